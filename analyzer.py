@@ -1,5 +1,14 @@
 import os
 os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+import re
+import bisect
+import csv
+import json
+import functools
+import hashlib
+import tempfile
+from collections import namedtuple, deque
+import itertools
 import warnings
 warnings.filterwarnings(
     "ignore",
@@ -12,13 +21,14 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import pygame
 import threading
+from concurrent.futures import ThreadPoolExecutor
 import time
 from pydub import AudioSegment
 import math
 import matplotlib
 matplotlib.use("TkAgg")
 import matplotlib.pyplot as plt
-from bpm_visuals import plot_deviation_heatmap, plot_bpm_timeseries, plot_distributions
+from bpm_visuals import plot_deviation_heatmap, plot_bpm_timeseries, plot_distributions, prepare_plot_arrays
 from plot_config import apply_plot_style
 apply_plot_style()
 from matplotlib.figure import Figure
@@ -27,12 +37,357 @@ import sounddevice as sd
 from scipy import signal
 from datetime import datetime
 import wave
+import struct
+import shutil
+import subprocess
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import mutagen
+except ImportError:  # mutagen is optional; ffprobe or pydub is used instead
+    mutagen = None
 
 
 
 
 from bpm_core import BPMAnalyzer
 
+# Inline Markdown patterns for AI feedback rendering. Atomic groups and
+# newline-excluding classes keep a failed match from rescanning the line.
+_RE_MD_LINK = re.compile(r"\[(?>([^\]\n]+))\]\((?>([^)\n]+))\)")
+_RE_MD_CODE = re.compile(r"`(?>([^`\n]+))`")
+_RE_MD_BOLD = re.compile(r"\*\*(?>([^*\n]+))\*\*|__(?>([^_\n]+))__")
+_RE_MD_ITALIC = re.compile(r"(?<!\*)\*(?>([^*\n]+))\*(?!\*)|(?<!_)_(?>([^_\n]+))_")
+# Block-level patterns
+_RE_MD_HEADING = re.compile(r"^(#{1,6})\s+(.*)$")
+_RE_MD_HR = re.compile(r"^\s*(\*{3,}|-{3,}|_{3,})\s*$")
+_RE_MD_QUOTE = re.compile(r"^>\s?(.*)$")
+_RE_MD_UL = re.compile(r"^(\s*)([-*+]\s+)(.*)$")
+_RE_MD_OL = re.compile(r"^(\s*)(\d+\.\s+)(.*)$")
+
+_MdSpan = namedtuple('_MdSpan', ['text', 'tags', 'link'])
+
+
+def _apply_inline(text):
+    """
+    Split a line into inline Markdown segments
+    
+    Parameters:
+        text: Single line of Markdown text
+        
+    Returns:
+        List of (segment_text, tags, link_url) tuples
+    """
+    segments = []
+    i = 0
+    while i < len(text):
+        # Links: [text](url)
+        m = _RE_MD_LINK.search(text[i:])
+        if m:
+            pre = text[i:i+m.start()]
+            if pre:
+                segments.append((pre, (), None))
+            segments.append((m.group(1), (), m.group(2)))
+            i += m.end()
+            continue
+        # Inline code: `code`
+        m = _RE_MD_CODE.search(text[i:])
+        if m:
+            pre = text[i:i+m.start()]
+            if pre:
+                segments.append((pre, (), None))
+            segments.append((m.group(1), ('code',), None))
+            i += m.end()
+            continue
+        # Bold: **text** or __text__
+        m = _RE_MD_BOLD.search(text[i:])
+        if m:
+            pre = text[i:i+m.start()]
+            if pre:
+                segments.append((pre, (), None))
+            bold_text = m.group(1) if m.group(1) is not None else m.group(2)
+            segments.append((bold_text, ('bold',), None))
+            i += m.end()
+            continue
+        # Italic: *text* or _text_
+        m = _RE_MD_ITALIC.search(text[i:])
+        if m:
+            pre = text[i:i+m.start()]
+            if pre:
+                segments.append((pre, (), None))
+            italic_text = m.group(1) if m.group(1) is not None else m.group(2)
+            segments.append((italic_text, ('italic',), None))
+            i += m.end()
+            continue
+        # No more markup
+        segments.append((text[i:], (), None))
+        break
+    return segments
+
+
+def _md_line_spans(line_text, base_tag=None):
+    """
+    Build the spans for one rendered line: its inline segments plus a newline
+    
+    Parameters:
+        line_text: Line content without block markup
+        base_tag: Optional block-level tag applied to every segment
+        
+    Returns:
+        List of _MdSpan
+    """
+    base = (base_tag,) if base_tag else ()
+    spans = [_MdSpan(seg_text, base + tags, link) for seg_text, tags, link in _apply_inline(line_text)]
+    spans.append(_MdSpan("\n", (), None))
+    return spans
+
+
+# Block handlers: each owns its pattern and returns the line's spans, or None
+# if the line is not that kind of block.
+def _md_try_heading(line):
+    m = _RE_MD_HEADING.match(line)
+    if m:
+        return _md_line_spans(m.group(2), base_tag=f"h{len(m.group(1))}")
+    return None
+
+
+def _md_try_hr(line):
+    if _RE_MD_HR.match(line):
+        return [_MdSpan("-" * 80 + "\n", (), None)]
+    return None
+
+
+def _md_try_quote(line):
+    m = _RE_MD_QUOTE.match(line)
+    if m:
+        return _md_line_spans(m.group(1), base_tag='quote')
+    return None
+
+
+def _md_try_list(line):
+    # Lists (unordered and ordered), with indentation
+    lm = _RE_MD_UL.match(line)
+    m = lm or _RE_MD_OL.match(line)
+    if m:
+        indent = len(m.group(1)) // 2
+        indent_tag = 'list1' if indent == 1 else ('list2' if indent == 2 else ('list3' if indent >= 3 else None))
+        bullet = '• ' if lm else m.group(2)
+        return _md_line_spans(bullet + m.group(3), base_tag=indent_tag)
+    return None
+
+
+def _md_try_hr_or_list(line):
+    return _md_try_hr(line) or _md_try_list(line)
+
+
+# Candidate block handler keyed by a line's first non-space character. Lines
+# whose first character is not listed (plain paragraphs) skip block regexes.
+_MD_BLOCK_DISPATCH = {
+    '#': _md_try_heading,
+    '>': _md_try_quote,
+    '-': _md_try_hr_or_list,
+    '*': _md_try_hr_or_list,
+    '_': _md_try_hr,
+    '+': _md_try_list,
+}
+_MD_BLOCK_DISPATCH.update(dict.fromkeys('0123456789', _md_try_list))
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_markdown(md):
+    """
+    Parse Markdown into text spans ready for insertion into a Tk Text widget.
+    Supports headings, bold/italic, inline code, code blocks, lists (ordered/unordered
+    with indentation), blockquotes, horizontal rules, links and simple tables.
+    
+    Parameters:
+        md: Markdown source string
+        
+    Returns:
+        Tuple of _MdSpan(text, tags, link) in insertion order. Results are cached
+        and shared, so callers must not mutate them.
+    """
+    spans = []
+    
+    # Parse block-level elements
+    lines = md.splitlines()
+    in_codeblock = False
+    codeblock_buffer = []
+    for raw in lines:
+        line = raw.rstrip('\n')
+        stripped = line.strip()
+        if in_codeblock:
+            if stripped.startswith('```'):
+                # Flush code block
+                spans.append(_MdSpan("\n".join(codeblock_buffer) + "\n", ('codeblock',), None))
+                codeblock_buffer = []
+                in_codeblock = False
+            else:
+                codeblock_buffer.append(line)
+            continue
+
+        # Start code block
+        if stripped.startswith('```'):
+            in_codeblock = True
+            codeblock_buffer = []
+            continue
+
+        if not stripped:
+            spans.append(_MdSpan("\n", (), None))
+            continue
+
+        # Headings, rules, blockquotes and lists
+        handler = _MD_BLOCK_DISPATCH.get(stripped[0])
+        block = handler(line) if handler else None
+        if block is not None:
+            spans.extend(block)
+        elif '|' in line:
+            # Tables: simple pipe-delimited rows rendered as monospaced text
+            spans.extend(_md_line_spans(line.replace('|', ' | '), base_tag='code'))
+        else:
+            # Paragraph
+            spans.extend(_md_line_spans(line))
+    return tuple(spans)
+
+
+# Canonical 44-byte WAV header: RIFF chunk, 16-byte PCM fmt chunk, data chunk
+_WAV_HDR = struct.Struct('<4sI4s4sIHHIIHH4sI')
+
+# Upper bounds (percent BPM difference) of each comparison level but the last;
+# _MATCH_LEVELS[i] is (similarity, color, feedback) for bisect_right(_MATCH_BREAKS, diff) == i
+_MATCH_BREAKS = (2, 5, 10, 15)
+_MATCH_LEVELS = (
+    ("Perfect Match", "green", "Excellent timing! You're perfectly in sync."),
+    ("Very Good Match", "#4CAF50", "Great job! Your timing is very close."),  # Darker green
+    ("Good Match", "#8BC34A", "Good timing. Slight adjustments could make it perfect."),  # Light green
+    ("Fair Match", "#FFC107", "Decent timing. Try to [speed up/slow down] to match better."),  # Yellow
+    ("Not Well Matched", "#F44336", "Significant timing difference. Try to [speed up/slow down] considerably."),  # Red
+)
+
+# Charts draw at most this many points; longer series are LTTB-downsampled
+_CHART_MAX_POINTS = 500
+
+
+def _lttb_indices(x, y, threshold):
+    """
+    Indices of the points kept by Largest-Triangle-Three-Buckets downsampling
+    
+    The first and last points are always kept; the rest are split into
+    threshold - 2 buckets, and each bucket keeps the point forming the largest
+    triangle with the previously kept point and the next bucket's average,
+    which preserves peaks and the overall shape of the curve.
+    
+    Parameters:
+        x: 1D array of increasing x values
+        y: 1D array of y values
+        threshold: Number of points to keep
+        
+    Returns:
+        Increasing index array (all indices if there are no more than threshold points)
+    """
+    n = len(x)
+    if threshold < 3 or n <= threshold:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.intp)
+    keep = np.empty(threshold, dtype=np.intp)
+    keep[0] = 0
+    keep[-1] = n - 1
+    a = 0
+    for i in range(threshold - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # Average of the next bucket; the last point stands in after the final bucket
+        next_lo, next_hi = (edges[i + 1], edges[i + 2]) if i + 2 < len(edges) else (n - 1, n)
+        cx = x[next_lo:next_hi].mean()
+        cy = y[next_lo:next_hi].mean()
+        # Twice the triangle areas for every candidate in the bucket at once
+        area = np.abs((x[a] - cx) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (cy - y[a]))
+        a = lo + int(np.argmax(area))
+        keep[i + 1] = a
+    return keep
+
+
+def _probe_duration(path):
+    """
+    Get an audio file's duration from its headers without decoding the audio
+    
+    Tries the WAV header, then mutagen (MP3/FLAC/OGG/M4A...), then ffprobe;
+    a full pydub decode is only the last resort. Results are cached per file
+    version, so pressing play again does not re-probe an unchanged file.
+    
+    Parameters:
+        path: Path to audio file
+        
+    Returns:
+        Duration in seconds
+    """
+    st = os.stat(path)
+    return _probe_duration_cached(path, st.st_mtime_ns, st.st_size)
+
+
+def _is_pcm_wav(path):
+    """
+    Check whether a file is a PCM WAV the mixer can play without conversion
+    
+    Parameters:
+        path: Path to audio file
+        
+    Returns:
+        True if the wave module can open the file
+    """
+    if not path.lower().endswith('.wav'):
+        return False
+    try:
+        with wave.open(path, 'rb'):
+            return True
+    except (wave.Error, EOFError, OSError):
+        return False
+
+
+@functools.lru_cache(maxsize=32)
+def _probe_duration_cached(path, mtime_ns, size):
+    """
+    Uncached duration probe behind _probe_duration; the modification time and
+    size only key the cache
+    """
+    if path.lower().endswith('.wav'):
+        # One read and unpack for canonical headers
+        with open(path, 'rb') as f:
+            hdr = f.read(_WAV_HDR.size)
+            file_size = os.fstat(f.fileno()).st_size
+        if len(hdr) == _WAV_HDR.size:
+            (riff, _, wave_id, fmt_id, fmt_size, _, _, _, byte_rate, _, _,
+             data_id, data_size) = _WAV_HDR.unpack(hdr)
+            if (riff, wave_id, fmt_id, fmt_size, data_id) == (b'RIFF', b'WAVE', b'fmt ', 16, b'data') and byte_rate:
+                return min(data_size, file_size - _WAV_HDR.size) / byte_rate
+        # Extra chunks or an extended fmt chunk: let the wave module walk them
+        try:
+            with wave.open(path, 'rb') as wf:
+                return wf.getnframes() / float(wf.getframerate())
+        except (wave.Error, EOFError):
+            pass  # e.g. float or compressed WAV; try the other probes
+    
+    if mutagen is not None:
+        try:
+            info = mutagen.File(path)
+            if info is not None and info.info.length > 0:
+                return float(info.info.length)
+        except Exception:
+            pass
+    
+    ffprobe = shutil.which('ffprobe')
+    if ffprobe:
+        try:
+            result = subprocess.run(
+                [ffprobe, '-v', 'error', '-show_entries', 'format=duration', '-of', 'csv=p=0', path],
+                capture_output=True, text=True, timeout=10)
+            return float(result.stdout.strip())
+        except (subprocess.SubprocessError, ValueError):
+            pass
+    
+    return AudioSegment.from_file(path).duration_seconds
+
+
 class BPMGUIApp:
     def __init__(self, root):
         """
@@ -63,6 +418,11 @@ class BPMGUIApp:
         self.playing = False
         self.playback_position = 0
         self.temp_wav_file = None
+        # Playback WAVs converted this session, removed on exit
+        self._temp_files = set()
+        # Single worker for WAV conversion, so the Tk thread never blocks on it
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+        self._wav_future = None
         self.playback_thread = None
         self.update_timer_id = None
         self.time_bpm_pairs = []
@@ -86,6 +446,10 @@ class BPMGUIApp:
         self.reference_file = None
         self.comparison_results = []
         
+        # Shared HTTP session so repeated DeepSeek requests reuse pooled connections
+        self._http = requests.Session()
+        self._http.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+        
         # Create widgets
         self._create_widgets()
         
@@ -94,6 +458,72 @@ class BPMGUIApp:
         
         # Set up window close handler
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+        
+        # Worker threads publish progress here; a 10 Hz ticker applies it, so
+        # Tk sees at most one progress update per tick however fast they run
+        self._progress_pending = None
+        self._tick_ui_id = self.root.after(100, self._tick_ui)
+    
+    def _tick_ui(self):
+        """
+        Apply the latest progress published by worker threads, then reschedule
+        """
+        pending = self._progress_pending
+        if pending is not None:
+            self._progress_pending = None
+            # Whole percentages; the bar is only touched when the value moves
+            if pending != self.progress_var.get():
+                self.progress_var.set(pending)
+        self._tick_ui_id = self.root.after(100, self._tick_ui)
+    
+    @property
+    def time_bpm_pairs(self):
+        """
+        Reference BPM series as a list of (time_seconds, bpm) tuples
+        
+        The series is stored as two float64 arrays (self._times, self._bpms)
+        so statistics run directly over contiguous buffers; the pair list is
+        built on first access and cached until the series changes.
+        """
+        if self._time_bpm_pairs is None:
+            self._time_bpm_pairs = list(zip(self._times.tolist(), self._bpms.tolist()))
+        return self._time_bpm_pairs
+    
+    @time_bpm_pairs.setter
+    def time_bpm_pairs(self, pairs):
+        self._set_bpm_series([t for t, _ in pairs], [b for _, b in pairs])
+    
+    def _set_bpm_series(self, times, bpms):
+        """
+        Replace the reference BPM series
+        
+        Parameters:
+            times: Segment start times in seconds
+            bpms: BPM value per segment
+        """
+        self._times = np.asarray(times, dtype=np.float64)
+        self._bpms = np.asarray(bpms, dtype=np.float64)
+        self._time_bpm_pairs = None
+        self._stats = None
+        self._chart_bounds = None
+    
+    def _bpm_stats(self):
+        """
+        Mean, minimum, maximum and standard deviation of the reference BPM series
+        
+        Computed once per series and cached until the series is replaced.
+        
+        Returns:
+            Tuple of (mean, min, max, std), or None if the series is empty
+        """
+        if self._stats is None and self._bpms.size:
+            bpms = self._bpms
+            mean = bpms.mean()
+            # Reuse the mean for the deviation instead of a second mean pass in std()
+            deviation = bpms - mean
+            std = np.sqrt(np.dot(deviation, deviation) / bpms.size)
+            self._stats = (mean, bpms.min(), bpms.max(), std)
+        return self._stats
     
     def _setup_style(self):
         """
@@ -205,7 +635,7 @@ class BPMGUIApp:
         # Removed BPM and Category displays (no longer needed)
         
         # Progress bar (analysis only)
-        self.progress_var = tk.DoubleVar()
+        self.progress_var = tk.IntVar()
         self.progress_bar = ttk.Progressbar(results_section, variable=self.progress_var, style="Modern.Horizontal.TProgressbar")
         self.progress_bar.grid(row=0, column=0, columnspan=2, sticky="ew", padx=5, pady=2)
         
@@ -226,6 +656,10 @@ class BPMGUIApp:
 
         self.canvas = FigureCanvasTkAgg(self.fig, master=ref_container)
         self.canvas.get_tk_widget().grid(row=0, column=0, sticky="nsew")
+        # Playback cursor artists, blitted over a cached render of the chart
+        self._cursor_artists = []
+        self._chart_background = None
+        self.canvas.mpl_connect('draw_event', self._on_chart_draw)
         
         # Clear initial plot
         self.ax.clear()
@@ -413,13 +847,8 @@ class BPMGUIApp:
         )
         
         if file_path:
-            # Reset temporary WAV file and playback state when selecting a new file
-            if hasattr(self, 'temp_wav_file') and self.temp_wav_file and os.path.exists(self.temp_wav_file):
-                try:
-                    os.remove(self.temp_wav_file)
-                    print(f"Removed old temp WAV file: {self.temp_wav_file}")
-                except Exception as e:
-                    print(f"Error removing old temp WAV: {e}")
+            # Reset playback state when selecting a new file; the previous file's
+            # converted WAV stays cached in case it is selected again
             self.temp_wav_file = None
             self.playing = False
             self.playback_position = 0
@@ -446,9 +875,8 @@ class BPMGUIApp:
             if not self.audio_file:
                 return
                 
-            # Try to get duration using pydub
-            audio = AudioSegment.from_file(self.audio_file)
-            self.ref_audio_duration = audio.duration_seconds
+            # Read duration from the file headers (no full decode on the Tk thread)
+            self.ref_audio_duration = _probe_duration(self.audio_file)
             
             # Format duration as MM:SS
             minutes = int(self.ref_audio_duration // 60)
@@ -608,71 +1036,61 @@ class BPMGUIApp:
         Thread function for audio file analysis
         """
         try:
-            # Load audio file
-            audio = AudioSegment.from_file(self.audio_file)
-            
-            # Convert to mono if stereo
-            if audio.channels > 1:
-                audio = audio.set_channels(1)
-            
-            # Set sample rate to 44.1kHz
-            audio = audio.set_frame_rate(44100)
-            
-            # Convert to numpy array
-            samples = np.array(audio.get_array_of_samples())
-            
-            # Normalize to [-1, 1]
-            max_val = 2 ** (audio.sample_width * 8 - 1)
-            samples = samples.astype(np.float32) / max_val
-            
             # Analyze in segments (user-selected seconds, no overlap)
             try:
                 segment_duration = float(self.bpm_interval_var.get()) if hasattr(self, 'bpm_interval_var') else 3.0
             except Exception:
                 segment_duration = 3.0
-            segment_samples = int(segment_duration * audio.frame_rate)
-            overlap_samples = 0  # no overlap to enforce cadence for smoother results
             
             self.time_bpm_pairs = []
             
-            # Calculate total segments
-            total_segments = max(1, int((len(samples) - segment_samples) / (segment_samples - overlap_samples)) + 1)
-            
-            for i in range(total_segments):
-                # Calculate segment start and end indices
-                start_idx = i * (segment_samples - overlap_samples)
-                end_idx = start_idx + segment_samples
-                
-                # Ensure we don't go beyond the audio
-                if end_idx > len(samples):
-                    end_idx = len(samples)
-                    start_idx = max(0, end_idx - segment_samples)
-                
-                # Extract segment
-                segment = samples[start_idx:end_idx]
-                
-                # Calculate segment time in seconds
-                segment_time = start_idx / audio.frame_rate
-                
-                # Analyze segment
-                bpm = self.analyzer.analyze_audio_segment(segment, audio.frame_rate)
+            # Stream segments from a decoder thread when soundfile can read the
+            # file, so analysis starts on the first segment instead of after
+            # the whole track is decoded
+            stream = self.analyzer.stream_audio_segments(self.audio_file, segment_duration)
+            if stream is not None:
+                total_segments, segments = stream
+            else:
+                total_segments, segments = self._decoded_segments(segment_duration)
+            
+            # Analyze segments in parallel; the NumPy/SciPy work releases the GIL.
+            # Futures are collected in submission order, so the pairs stay sorted,
+            # and only a bounded number are in flight to cap decoded memory.
+            workers = os.cpu_count() or 1
+            times = np.empty(total_segments, dtype=np.float64)
+            bpms = np.empty(total_segments, dtype=np.float64)
+            done = 0
+            try:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    pending = deque()
                 
-                # Add to results
-                self.time_bpm_pairs.append((segment_time, bpm))
+                    def collect():
+                        nonlocal done
+                        times[done], future = pending.popleft()
+                        bpms[done] = future.result()
+                        done += 1
+                        # Publish progress for the UI ticker
+                        self._progress_pending = done * 100 // total_segments
                 
-                # Update progress bar
-                progress_percentage = (i + 1) / total_segments * 100
-                self.root.after(0, lambda p=progress_percentage: self.progress_var.set(p))
+                    for segment_time, segment, sample_rate in segments:
+                        pending.append((segment_time, executor.submit(self.analyzer.analyze_audio_segment, segment, sample_rate)))
+                        if len(pending) >= 2 * workers:
+                            collect()
+                    while pending:
+                        collect()
+            finally:
+                # Release the decoder thread (and its open file) even when a
+                # segment's analysis raised before the stream was drained
+                if stream is not None:
+                    segments.close()
+            self._set_bpm_series(times[:done], bpms[:done])
             
             # Calculate overall BPM
-            if self.time_bpm_pairs:
-                bpm_values = [bpm for _, bpm in self.time_bpm_pairs]
-                avg_bpm = np.mean(bpm_values)
+            if self._bpms.size:
+                avg_bpm = self._bpm_stats()[0]
                 
-                # Update UI with results
-                self.root.after(0, lambda: self._update_bpm_display(avg_bpm))
-                self.root.after(0, self._update_bpm_description)
-                self.root.after(0, self._create_bpm_chart)
+                # Update UI with results in a single Tk callback
+                self.root.after(0, self._finalize_analysis, avg_bpm)
             
         except Exception as e:
             print(f"Error in analysis thread: {e}")
@@ -682,7 +1100,48 @@ class BPMGUIApp:
             self.analyzing = False
             
             # Set progress to 100% when done
-            self.root.after(0, lambda: self.progress_var.set(100))
+            self._progress_pending = 100
+    
+    def _decoded_segments(self, segment_duration):
+        """
+        Decode the whole audio file and split it into consecutive segments
+        
+        Returns:
+            Tuple of (segment count, list of (segment_time, samples, sample_rate))
+        """
+        # Decode once into mono 44.1kHz float32 samples (no intermediate
+        # sample array or separate normalization pass)
+        samples, sample_rate = self.analyzer._load_audio_file(self.audio_file)
+        segment_samples = int(segment_duration * sample_rate)
+        
+        # Calculate total segments
+        total_segments = max(1, int((len(samples) - segment_samples) / segment_samples) + 1)
+        
+        segments = []
+        for i in range(total_segments):
+            # Calculate segment start and end indices
+            start_idx = i * segment_samples
+            end_idx = start_idx + segment_samples
+            
+            # Ensure we don't go beyond the audio
+            if end_idx > len(samples):
+                end_idx = len(samples)
+                start_idx = max(0, end_idx - segment_samples)
+            
+            # Extract segment (a view, no copy) and its time in seconds
+            segments.append((start_idx / sample_rate, samples[start_idx:end_idx], sample_rate))
+        return total_segments, segments
+    
+    def _finalize_analysis(self, avg_bpm):
+        """
+        Show the results of a finished reference analysis
+        
+        Parameters:
+            avg_bpm: Overall BPM of the analyzed file
+        """
+        self._update_bpm_display(avg_bpm)
+        self._update_bpm_description()
+        self._create_bpm_chart()
     
     def _update_bpm_display(self, bpm):
         """
@@ -710,25 +1169,51 @@ class BPMGUIApp:
         """
         if not hasattr(self, 'time_bpm_pairs') or not self.time_bpm_pairs:
             return
-            
-        # Clear previous plot
-        self.ax.clear()
         
         # Extract data
-        times, bpms = zip(*self.time_bpm_pairs)
-        times_seconds = list(times)  # Use seconds directly
+        times_seconds = self._times  # Use seconds directly
+        bpms = self._bpms
+        
+        # Appropriate y-axis limits, from the cached series statistics
+        avg_bpm, bpm_lo, bpm_hi, _ = self._bpm_stats()
+        min_bpm = max(40, bpm_lo - 10)
+        max_bpm = min(220, bpm_hi + 10)
+        
+        # X-axis limits include the full audio duration or data extent
+        try:
+            duration = float(getattr(self, 'ref_audio_duration', 0.0)) or 0.0
+        except Exception:
+            duration = 0.0
+        max_time = times_seconds.max()
+        right_limit = duration if duration > 0 else (max_time + 2)
+        if right_limit < 5:
+            right_limit = 5
+        
+        # The chart depends only on the series and these bounds; skip the
+        # rebuild when neither changed (e.g. while the range slider is dragged)
+        bounds = (min_bpm, max_bpm, right_limit)
+        if bounds == self._chart_bounds:
+            return
+        self._chart_bounds = bounds
+        
+        # Clear previous plot
+        self.ax.clear()
         
         # Apply smoothing to BPM values for better visualization
         smoothed_bpms = self._smooth_bpm_values(bpms)
         
+        # Long tracks are drawn from LTTB-downsampled points; the statistics
+        # below (and the table and CSV export) still use every segment
+        line_idx = _lttb_indices(times_seconds, smoothed_bpms, _CHART_MAX_POINTS)
+        point_idx = _lttb_indices(times_seconds, bpms, _CHART_MAX_POINTS)
+        
         # Plot smoothed BPM curve
-        self.ax.plot(times_seconds, smoothed_bpms, 'b-', linewidth=2, alpha=0.7, label='BPM')
+        self.ax.plot(times_seconds[line_idx], smoothed_bpms[line_idx], 'b-', linewidth=2, alpha=0.7, label='BPM')
         
         # Plot original BPM points
-        self.ax.scatter(times_seconds, bpms, color='r', s=30, alpha=0.5, label='Raw BPM')
+        self.ax.scatter(times_seconds[point_idx], bpms[point_idx], color='r', s=30, alpha=0.5, label='Raw BPM')
         
         # Add average BPM line
-        avg_bpm = np.mean(bpms)
         self.ax.axhline(y=avg_bpm, color='g', linestyle='--', alpha=0.7, label=f'Avg BPM: {avg_bpm:.1f}')
         
         # Configure plot
@@ -736,26 +1221,21 @@ class BPMGUIApp:
         self.ax.set_xlabel("Time (seconds)")
         self.ax.set_ylabel("BPM")
         
-        # Set appropriate y-axis limits
-        min_bpm = max(40, np.min(bpms) - 10)
-        max_bpm = min(220, np.max(bpms) + 10)
+        # Set axis limits
         self.ax.set_ylim(min_bpm, max_bpm)
-        
-        # Set x-axis limits to include the full audio duration or data extent
-        try:
-            duration = float(getattr(self, 'ref_audio_duration', 0.0)) or 0.0
-        except Exception:
-            duration = 0.0
-        max_time = max(times_seconds) if times_seconds else 0.0
-        right_limit = duration if duration > 0 else (max_time + 2)
-        if right_limit < 5:
-            right_limit = 5
         self.ax.set_xlim(0, right_limit)
         
         # Add grid and legend
         self.ax.grid(True, alpha=0.3)
         self.ax.legend(loc='upper right')
         
+        # Playback cursor; animated artists are left out of full redraws and
+        # blitted over the cached chart instead
+        self._cursor_artists = [
+            self.ax.axvline(x=0, color='red', linestyle=':', alpha=0.8, animated=True, visible=False),
+            self.ax.text(0, 0, "", color='red', alpha=0.8, animated=True, visible=False),
+        ]
+        
         # Ensure title is not clipped
         try:
             self.fig.subplots_adjust(top=0.92)
@@ -802,25 +1282,21 @@ class BPMGUIApp:
                     self.bpm_category_label.config(text="Processing audio file...")
                 
                 try:
-                    # Process the audio file directly
-                    audio = AudioSegment.from_file(self.audio_file)
-                    
-                    # Convert to numpy array
-                    samples = np.array(audio.get_array_of_samples())
-                    
-                    # Normalize to [-1, 1]
-                    max_val = 2 ** (audio.sample_width * 8 - 1)
-                    samples = samples.astype(np.float32) / max_val
+                    # Decode through the same mono float32 loader as the analysis thread
+                    samples, sample_rate = self.analyzer._load_audio_file(self.audio_file)
                     
                     # Analyze in segments (3 seconds each, no overlap)
                     segment_duration = 3.0  # seconds
-                    segment_samples = int(segment_duration * audio.frame_rate)
+                    segment_samples = int(segment_duration * sample_rate)
                     overlap_samples = 0  # no overlap to enforce 3s cadence
                     
                     self.time_bpm_pairs = []
                     
                     # Calculate total segments
                     total_segments = max(1, int((len(samples) - segment_samples) / (segment_samples - overlap_samples)) + 1)
+                    times = np.empty(total_segments, dtype=np.float64)
+                    bpms = np.empty(total_segments, dtype=np.float64)
+                    last_pct = -1
                     
                     for i in range(total_segments):
                         # Calculate segment start and end indices
@@ -836,28 +1312,27 @@ class BPMGUIApp:
                         segment = samples[start_idx:end_idx]
                         
                         # Calculate segment time in seconds
-                        segment_time = start_idx / audio.frame_rate
-                        
-                        # Analyze segment
-                        bpm = self.analyzer.analyze_audio_segment(segment, audio.frame_rate)
+                        segment_time = start_idx / sample_rate
                         
-                        # Add to results
-                        self.time_bpm_pairs.append((segment_time, bpm))
+                        # Analyze segment and add to results
+                        times[i] = segment_time
+                        bpms[i] = self.analyzer.analyze_audio_segment(segment, sample_rate)
                         
-                        # Update progress bar
-                        progress_percentage = (i + 1) / total_segments * 100
-                        self.progress_var.set(progress_percentage)
-                        self.root.update_idletasks()  # Force UI update
+                        # Update progress bar, redrawing only when the whole percentage changes
+                        pct = (i + 1) * 100 // total_segments
+                        if pct != last_pct:
+                            last_pct = pct
+                            self.progress_var.set(pct)
+                            self.root.update_idletasks()  # Force UI update
+                    
+                    self._set_bpm_series(times, bpms)
                     
                     # Calculate overall BPM
-                    if self.time_bpm_pairs:
-                        bpm_values = [bpm for _, bpm in self.time_bpm_pairs]
-                        avg_bpm = np.mean(bpm_values)
+                    if self._bpms.size:
+                        avg_bpm = self._bpm_stats()[0]
                         
                         # Update UI with results
-                        self._update_bpm_display(avg_bpm)
-                        self._update_bpm_description()
-                        self._create_bpm_chart()
+                        self._finalize_analysis(avg_bpm)
                     
                 except Exception as e:
                     print(f"Error in analysis: {e}")
@@ -870,18 +1345,11 @@ class BPMGUIApp:
                     # Set progress to 100%
                     self.progress_var.set(100)
         
-        if not hasattr(self, 'temp_wav_file') or self.temp_wav_file is None or not os.path.exists(self.temp_wav_file):
-            # Convert audio to WAV for playback if needed
-            try:
-                print("Converting to WAV for playback...")
-                self._convert_to_wav_for_playback()
-                print(f"WAV conversion complete: {self.temp_wav_file}")
-            except Exception as e:
-                print(f"Error in conversion: {e}")
-                messagebox.showerror("Error", f"Error preparing audio for playback:\n{str(e)}")
-                return
-        else:
-            print(f"Using existing temp WAV: {self.temp_wav_file}")
+        # Convert audio to WAV for playback if needed; playback resumes here once it is ready
+        if not self._ensure_playback_wav(self.toggle_playback):
+            print("Converting to WAV for playback...")
+            return
+        print(f"Using temp WAV: {self.temp_wav_file}")
         
         print(f"Current playing state: {self.playing}")
         if not self.playing:
@@ -901,12 +1369,8 @@ class BPMGUIApp:
             messagebox.showwarning("Warning", "Please select an audio file first")
             return
         # Ensure temp WAV exists
-        if not hasattr(self, 'temp_wav_file') or self.temp_wav_file is None or not os.path.exists(self.temp_wav_file):
-            try:
-                self._convert_to_wav_for_playback()
-            except Exception as e:
-                messagebox.showerror("Error", f"Error preparing audio for playback:\n{str(e)}")
-                return
+        if not self._ensure_playback_wav(self.toggle_ref_playback):
+            return
         # Set current playback file
         self.current_playback_file = self.temp_wav_file
         # Reset any sliced load path and offset
@@ -934,12 +1398,8 @@ class BPMGUIApp:
             messagebox.showwarning("Warning", "Please select an audio file first")
             return
         # Ensure temp WAV exists
-        if not hasattr(self, 'temp_wav_file') or self.temp_wav_file is None or not os.path.exists(self.temp_wav_file):
-            try:
-                self._convert_to_wav_for_playback()
-            except Exception as e:
-                messagebox.showerror("Error", f"Error preparing audio for playback:\n{str(e)}")
-                return
+        if not self._ensure_playback_wav(self._ref_play):
+            return
         # Set playback source to reference file
         self.current_playback_file = self.temp_wav_file
         # Sync playback_position from reference seek bar before play
@@ -951,7 +1411,7 @@ class BPMGUIApp:
             pass
         # Ensure duration and seek range
         try:
-            self.ref_audio_duration = AudioSegment.from_file(self.audio_file).duration_seconds
+            self.ref_audio_duration = _probe_duration(self.audio_file)
             if hasattr(self, 'seek_scale_ref'):
                 self.seek_scale_ref.configure(to=self.ref_audio_duration)
         except Exception:
@@ -980,7 +1440,7 @@ class BPMGUIApp:
         self.playback_position = 0.0
         # Refresh duration and UI for reference controls
         try:
-            self.ref_audio_duration = AudioSegment.from_file(self.audio_file).duration_seconds
+            self.ref_audio_duration = _probe_duration(self.audio_file)
             if hasattr(self, 'seek_var_ref'):
                 self.seek_var_ref.set(0.0)
             if hasattr(self, 'seek_scale_ref'):
@@ -1025,7 +1485,7 @@ class BPMGUIApp:
                 try:
                     pygame.mixer.music.set_pos(self.playback_position)
                     # Reset timer baseline to the new position
-                    self.last_update_time = time.time() - self.playback_position
+                    self.last_update_time = time.monotonic() - self.playback_position
                 except Exception as _:
                     # Fallback to restart playback at new position
                     self._start_playback()
@@ -1129,7 +1589,7 @@ class BPMGUIApp:
                 try:
                     pygame.mixer.music.set_pos(self.playback_position)
                     # Reset timer baseline to the new position
-                    self.last_update_time = time.time() - self.playback_position
+                    self.last_update_time = time.monotonic() - self.playback_position
                 except Exception:
                     # Fallback to restart playback at new position
                     self._start_playback()
@@ -1197,8 +1657,9 @@ class BPMGUIApp:
             timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
             self.temp_mic_wav_file = f"temp_mic_playback_{timestamp}.wav"
             samples = np.array(self.mic_buffer, dtype=np.float32)
-            samples = np.clip(samples, -1.0, 1.0)
-            samples_int16 = (samples * 32767).astype(np.int16)
+            np.clip(samples, -1.0, 1.0, out=samples)
+            samples *= np.float32(32767)
+            samples_int16 = samples.astype(np.int16)
             audio = AudioSegment(
                 data=samples_int16.tobytes(),
                 sample_width=2,
@@ -1215,24 +1676,98 @@ class BPMGUIApp:
             self.temp_mic_wav_file = None
             raise e
     
+    def _ensure_playback_wav(self, on_ready):
+        """
+        Make sure the playback WAV for the current audio file exists
+        
+        A missing WAV is converted on the I/O worker while the Tk thread stays
+        responsive; the reference play button shows a loading state meanwhile.
+        
+        Parameters:
+            on_ready: Callback run on the Tk thread once a started conversion succeeds
+            
+        Returns:
+            True if the WAV is ready now, False if the caller should return and
+            let on_ready continue later
+        """
+        if self.temp_wav_file and os.path.exists(self.temp_wav_file):
+            return True
+        if _is_pcm_wav(self.audio_file):
+            # Play PCM WAV sources directly instead of writing and reading back a copy
+            self.temp_wav_file = self.audio_file
+            return True
+        if self._wav_future is not None and not self._wav_future.done():
+            return False  # Already converting; that conversion's callback resumes playback
+        
+        if hasattr(self, 'play_button_ref'):
+            self.play_button_ref.config(text="…")
+            self.play_button_ref.state(['disabled'])
+        source = self.audio_file
+        self._wav_future = self._io_pool.submit(self._convert_to_wav_for_playback)
+        self._wav_future.add_done_callback(
+            lambda future: self.root.after(0, self._on_playback_wav_ready, future, source, on_ready))
+        return False
+    
+    def _on_playback_wav_ready(self, future, source, on_ready):
+        """
+        Finish a background WAV conversion on the Tk thread
+        
+        Parameters:
+            future: Completed conversion future
+            source: Audio file the conversion was started for
+            on_ready: Callback to continue playback with
+        """
+        if hasattr(self, 'play_button_ref'):
+            self.play_button_ref.state(['!disabled'])
+            self._update_ref_play_button_icon()
+        if source != self.audio_file:
+            # Another file was selected meanwhile; its WAV is converted on demand
+            self.temp_wav_file = None
+            return
+        error = future.exception()
+        if error is not None:
+            print(f"Error in conversion: {error}")
+            messagebox.showerror("Error", f"Error preparing audio for playback:\n{str(error)}")
+            return
+        print(f"WAV conversion complete: {self.temp_wav_file}")
+        on_ready()
+    
+    def _playback_wav_path(self):
+        """
+        Temporary WAV path for the current audio file
+        
+        Keyed by a hash of the file's path, modification time and size, so an
+        unchanged file is converted only once however often it is reloaded.
+        """
+        st = os.stat(self.audio_file)
+        source = f"{os.path.abspath(self.audio_file)}|{st.st_mtime_ns}|{st.st_size}"
+        key = hashlib.blake2b(source.encode(), digest_size=8).hexdigest()
+        return os.path.join(tempfile.gettempdir(), f"bpm_play_{key}.wav")
+    
     def _convert_to_wav_for_playback(self):
         """
-        Convert audio file to temporary WAV file for playback
+        Convert audio file to temporary WAV file for playback, reusing an
+        earlier conversion of the same file version
         """
+        partial_file = None
         try:
-            # Generate unique temporary filename
-            timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-            self.temp_wav_file = f"temp_playback_{timestamp}.wav"
+            self.temp_wav_file = self._playback_wav_path()
+            self._temp_files.add(self.temp_wav_file)
+            if os.path.exists(self.temp_wav_file):
+                return
             
-            # Convert to WAV using pydub
+            # Convert to WAV using pydub; export under a partial name so an
+            # interrupted conversion is never mistaken for a cached one
+            partial_file = f"{self.temp_wav_file}.part"
             audio = AudioSegment.from_file(self.audio_file)
-            audio.export(self.temp_wav_file, format="wav")
+            audio.export(partial_file, format="wav")
+            os.replace(partial_file, self.temp_wav_file)
             
         except Exception as e:
             # Clean up on error
-            if hasattr(self, 'temp_wav_file') and os.path.exists(self.temp_wav_file):
+            if partial_file and os.path.exists(partial_file):
                 try:
-                    os.remove(self.temp_wav_file)
+                    os.remove(partial_file)
                 except:
                     pass
             self.temp_wav_file = None
@@ -1268,7 +1803,8 @@ class BPMGUIApp:
                 print("Playback verification successful: music is playing")
                 print("Updating playback state...")
                 self.playing = True
-                self.last_update_time = time.time() - self.playback_position
+                self.last_update_time = time.monotonic() - self.playback_position
+                self._timer_text = None  # Labels may have been changed by a seek or reset
                 
                 print("Starting update timer...")
                 self._update_timer()
@@ -1295,8 +1831,9 @@ class BPMGUIApp:
         Pause audio playback
         """
         try:
-            # Get current position
-            self.playback_position = pygame.mixer.music.get_pos() / 1000.0  # Convert to seconds
+            # Get current position from the playback clock (get_pos() ignores
+            # the set_pos() offset of a seek)
+            self.playback_position = time.monotonic() - self.last_update_time
             
             # Pause playback
             pygame.mixer.music.pause()
@@ -1385,8 +1922,8 @@ class BPMGUIApp:
             return
             
         try:
-            # Calculate current position
-            current_time = time.time() - self.last_update_time
+            # Calculate current position from the monotonic playback clock
+            current_time = time.monotonic() - self.last_update_time
             # Avoid overwriting user-controlled position while dragging
             if not getattr(self, '_ref_is_dragging', False) and not getattr(self, '_mic_is_dragging', False):
                 self.playback_position = current_time
@@ -1401,9 +1938,12 @@ class BPMGUIApp:
             else:
                 duration_str = self._format_time(getattr(self, 'ref_audio_duration', 0.0))
             
-            # Update time label
-            if hasattr(self, 'time_label'):
-                self.time_label.config(text=f"{current_str} / {duration_str}")
+            # Update time labels only when the displayed second changes
+            time_text = f"{current_str} / {duration_str}"
+            text_changed = time_text != getattr(self, '_timer_text', None)
+            self._timer_text = time_text
+            if text_changed and hasattr(self, 'time_label'):
+                self.time_label.config(text=time_text)
             
             # Do not update progress bar during playback per UI request
             # Progress bar will only reflect analysis progress elsewhere
@@ -1415,15 +1955,15 @@ class BPMGUIApp:
                         if hasattr(self, 'seek_scale_ref'):
                             self.seek_scale_ref.configure(to=getattr(self, 'ref_audio_duration', 0.0))
                             self.seek_var_ref.set(current_time)
-                        if hasattr(self, 'time_label_ref'):
-                            self.time_label_ref.config(text=f"{current_str} / {duration_str}")
+                        if text_changed and hasattr(self, 'time_label_ref'):
+                            self.time_label_ref.config(text=time_text)
                 elif hasattr(self, 'current_playback_file') and hasattr(self, 'temp_mic_wav_file') and self.current_playback_file == self.temp_mic_wav_file:
                     if not getattr(self, '_mic_is_dragging', False):
                         if hasattr(self, 'seek_scale_mic'):
                             self.seek_scale_mic.configure(to=getattr(self, 'mic_audio_duration', 0.0))
                             self.seek_var_mic.set(current_time)
-                        if hasattr(self, 'mic_time_label'):
-                            self.mic_time_label.config(text=f"{current_str} / {duration_str}")
+                        if text_changed and hasattr(self, 'mic_time_label'):
+                            self.mic_time_label.config(text=time_text)
             except Exception as _:
                 pass
             
@@ -1455,12 +1995,9 @@ class BPMGUIApp:
         Highlight the current playback position on the BPM chart
         and update the current BPM display
         """
-        # Find the current BPM segment
-        current_bpm = None
-        for time_seconds, bpm in self.time_bpm_pairs:
-            if time_seconds > current_time:
-                break
-            current_bpm = bpm
+        # Find the current BPM segment: the last one starting at or before current_time
+        current_idx = np.searchsorted(self._times, current_time, side='right') - 1
+        current_bpm = self._bpms[current_idx] if current_idx >= 0 else None
         
         # Update current BPM display if found
         if current_bpm is not None:
@@ -1471,30 +2008,44 @@ class BPMGUIApp:
                     self.current_bpm_label.pack(pady=2)
                 self.current_bpm_label.config(text=f"Current: {current_bpm:.1f}")
             
-            # Find the index in our time_bpm_pairs for the current segment
-            times, bpms = zip(*self.time_bpm_pairs)
-            current_idx = 0
-            for i, t in enumerate(times):
-                if t > current_time:
-                    break
-                current_idx = i
-            
-            # Update the chart with a vertical line
-            # First, clear any existing vertical line
-            for line in getattr(self, '_vline', []):
-                line.remove()
-            
-            # Add new vertical line at current time (seconds)
-            self._vline = [self.ax.axvline(x=current_time, color='red', linestyle=':', alpha=0.8)]
+            # Update the chart with a vertical line at current time (seconds)
+            if not self._cursor_artists:
+                return
+            line, label = self._cursor_artists
+            line.set_xdata([current_time, current_time])
             
-            # Add a text label showing current BPM near the vertical line
+            # Move the text label showing current BPM near the vertical line
             y_min, y_max = self.ax.get_ylim()
             text_y_pos = y_min + (y_max - y_min) * 0.9
-            self._vline.append(self.ax.text(current_time + 0.01, text_y_pos, 
-                               f"{current_bpm:.1f} BPM", color='red', alpha=0.8))
+            label.set_position((current_time + 0.01, text_y_pos))
+            label.set_text(f"{current_bpm:.1f} BPM")
+            line.set_visible(True)
+            label.set_visible(True)
             
-            # Redraw the canvas
+            # Blit the cursor instead of re-rendering the whole chart
+            self._blit_chart_cursor()
+    
+    def _on_chart_draw(self, event):
+        """
+        Cache each full render of the reference chart and draw the cursor over it
+        """
+        self._chart_background = self.canvas.copy_from_bbox(self.fig.bbox)
+        for artist in self._cursor_artists:
+            if artist.get_visible():
+                self.fig.draw_artist(artist)
+    
+    def _blit_chart_cursor(self):
+        """
+        Redraw only the playback cursor on top of the cached chart render
+        """
+        if self._chart_background is None:
+            # The draw event caches the background and draws the cursor
             self.canvas.draw()
+            return
+        self.canvas.restore_region(self._chart_background)
+        for artist in self._cursor_artists:
+            self.fig.draw_artist(artist)
+        self.canvas.blit(self.fig.bbox)
     
     def _highlight_current_mic_bpm_position(self, current_time):
         try:
@@ -1503,7 +2054,7 @@ class BPMGUIApp:
             if not hasattr(self, 'ax_mic') or not hasattr(self, 'canvas_mic'):
                 return
             times, bpms = zip(*self.mic_time_bpm_pairs)
-            closest_idx = min(range(len(times)), key=lambda i: abs(times[i] - current_time))
+            closest_idx = int(np.argmin(np.abs(np.asarray(times, dtype=np.float64) - current_time)))
             # Remove previous mic vertical line(s)
             if hasattr(self, '_vline_mic') and self._vline_mic:
                 for line in self._vline_mic:
@@ -1549,7 +2100,9 @@ class BPMGUIApp:
             
             # Update state
             self.mic_recording = True
-            self.mic_buffer = []
+            # Rolling buffer of the last 10 seconds; the deque evicts old
+            # samples itself instead of re-slicing the whole list per callback
+            self.mic_buffer = deque(maxlen=self.mic_sample_rate * 10)
             self.mic_bpm_history = []
             
             # Initialize time tracking and BPM data for immediate chart display
@@ -1636,6 +2189,16 @@ class BPMGUIApp:
             # Run final analysis in UI thread
             self.root.after(0, self._perform_final_mic_analysis)
     
+    def _mic_tail(self, n_samples):
+        """
+        Copy the most recent samples of the mic buffer into a float32 array
+        
+        Parameters:
+            n_samples: Number of trailing samples to take
+        """
+        buf = self.mic_buffer
+        return np.fromiter(itertools.islice(buf, max(0, len(buf) - n_samples), None), dtype=np.float32)
+    
     def _mic_monitor_thread(self):
         """
         Thread function for microphone monitoring
@@ -1646,15 +2209,16 @@ class BPMGUIApp:
                 if status:
                     print(f"Mic status: {status}")
                 
-                # Add data to buffer
-                self.mic_buffer.extend(indata.flatten())
+                # Add data to buffer (oldest samples drop off past 10 seconds)
+                self.mic_buffer.extend(indata.ravel())
 
                 # Write to WAV in real-time
                 if getattr(self, 'mic_wave_writer', None) is not None:
                     try:
                         # Convert float32 [-1,1] to int16
-                        samples = np.clip(indata.flatten(), -1.0, 1.0)
-                        pcm16 = (samples * 32767.0).astype(np.int16).tobytes()
+                        samples = np.clip(indata.ravel(), -1.0, 1.0)
+                        samples *= np.float32(32767.0)
+                        pcm16 = samples.astype(np.int16).tobytes()
                         if getattr(self, 'mic_writer_lock', None) is not None:
                             with self.mic_writer_lock:
                                 self.mic_wave_writer.writeframes(pcm16)
@@ -1662,11 +2226,6 @@ class BPMGUIApp:
                             self.mic_wave_writer.writeframes(pcm16)
                     except Exception as e:
                         print(f"Error writing mic frames: {e}")
-                
-                # Keep buffer to last 10 seconds
-                max_buffer_size = self.mic_sample_rate * 10
-                if len(self.mic_buffer) > max_buffer_size:
-                    self.mic_buffer = self.mic_buffer[-max_buffer_size:]
             
             # Create audio stream
             self.mic_stream = sd.InputStream(
@@ -1684,12 +2243,9 @@ class BPMGUIApp:
                 # Prefer quick initial analysis with ~2s buffer, then switch to stable analysis (~7s)
                 if len(self.mic_buffer) >= self.mic_sample_rate * 7:
                     # Take a longer window (7 seconds) for more accurate BPM detection
-                    analysis_buffer = self.mic_buffer[-self.mic_sample_rate*7:].copy()
-                    
-                    # Normalize data with better handling of low volume
-                    max_val = np.max(np.abs(analysis_buffer))
-                    if max_val > 0:
-                        analysis_buffer = analysis_buffer / max_val
+                    # (analyze_audio_data peak-normalizes each segment itself, so the
+                    # window needs no separate normalization pass)
+                    analysis_buffer = self._mic_tail(self.mic_sample_rate * 7)
                     
                     # Perform multiple analyses on overlapping segments for stability
                     segment_duration = 5  # seconds
@@ -1762,11 +2318,12 @@ class BPMGUIApp:
                         self.mic_last_bpm_sample_ts = now_ts
                 elif len(self.mic_buffer) >= int(self.mic_sample_rate * 2):
                     # Quick initial BPM estimation on ~2 seconds for immediate plotting
-                    analysis_buffer = self.mic_buffer[-int(self.mic_sample_rate*2):].copy()
-                    max_val = np.max(np.abs(analysis_buffer))
-                    if max_val > 0:
-                        analysis_buffer = analysis_buffer / max_val
-                    quick_bpm = self.analyzer.analyze_audio_data(analysis_buffer, self.mic_sample_rate)
+                    # Normalize the window in place in float32; the analyzer can then
+                    # skip its own working copy
+                    analysis_buffer = self._mic_tail(int(self.mic_sample_rate * 2))
+                    self.analyzer._scale_to_peak(analysis_buffer)
+                    quick_bpm = self.analyzer.analyze_audio_data(analysis_buffer, self.mic_sample_rate,
+                                                                 assume_normalized=True)
                     if quick_bpm > 0:
                         self.mic_bpm = quick_bpm
                         self.root.after(0, lambda: (self.mic_bpm_label.config(text=f"{self.mic_bpm:.1f}") if hasattr(self, 'mic_bpm_label') else None))
@@ -1817,7 +2374,7 @@ class BPMGUIApp:
         """
         try:
             # Get the entire recorded buffer
-            full_buffer = np.array(self.mic_buffer)
+            full_buffer = np.array(self.mic_buffer, dtype=np.float32)
             
             # Check if buffer is empty
             if len(full_buffer) == 0:
@@ -1912,29 +2469,24 @@ class BPMGUIApp:
             if not hasattr(self, 'mic_time_bpm_pairs'):
                 self.mic_time_bpm_pairs = []
             
-            # Always initialize times and bpms to avoid undefined variable errors
-            times = []
-            bpms = []
-            
             # Extract data - ensure times and bpms have the same length
-            times = []
-            bpms = []
+            times = np.empty(0)
+            bpms = np.empty(0)
             if self.mic_time_bpm_pairs:
-                # Process pairs together to ensure times and bpms stay in sync
-                for pair in self.mic_time_bpm_pairs:
-                    # Skip invalid pairs
-                    if len(pair) < 2:
-                        continue
-                    
-                    # Check if time is valid
-                    if isinstance(pair[0], (int, float)) and not np.isnan(pair[0]):
-                        # For BPM, accept 0 only for the initial point
-                        if isinstance(pair[1], (int, float)) and not np.isnan(pair[1]) and (pair[1] > 0 or (len(times) == 0 and pair[0] == 0 and pair[1] == 0)):
-                            times.append(pair[0])
-                            bpms.append(pair[1])
+                # Validate all pairs at once: both values must be numbers, and
+                # BPM must be positive, except for an initial (0, 0) point
+                pairs = np.asarray(self.mic_time_bpm_pairs, dtype=np.float64).reshape(-1, 2)
+                t, b = pairs[:, 0], pairs[:, 1]
+                numeric = ~(np.isnan(t) | np.isnan(b))
+                accepted = numeric & ((b > 0) | ((t == 0) & (b == 0)))
+                valid = numeric & (b > 0)
+                if accepted.any():
+                    valid[np.argmax(accepted)] = True
+                times = t[valid]
+                bpms = b[valid]
             
             # If we have valid data points
-            if times and bpms and len(times) == len(bpms):
+            if times.size:
                 # Plot BPM curve with solid line - only if we have more than one point or the point is not the initial (0,0)
                 if len(bpms) > 1 or (len(bpms) == 1 and bpms[0] > 0):
                     self.ax_mic.plot(times, bpms, 'b-', linewidth=2.5, alpha=0.8, label='Microphone BPM')
@@ -1943,20 +2495,20 @@ class BPMGUIApp:
                     self.ax_mic.scatter(times, bpms, color='r', s=40, alpha=0.7, label='BPM Samples')
                     
                     # Add average BPM line if we have enough data (and exclude initial 0 value)
-                    valid_bpms = [bpm for bpm in bpms if bpm > 0]
-                    if len(valid_bpms) > 1:
-                        avg_bpm = np.mean(valid_bpms)
+                    valid_bpms = bpms[bpms > 0]
+                    if valid_bpms.size > 1:
+                        avg_bpm = valid_bpms.mean()
                         self.ax_mic.axhline(y=avg_bpm, color='g', linestyle='--', alpha=0.7, 
                                           label=f'Current Avg: {avg_bpm:.1f}')
                     
                     # Set appropriate y-axis limits - use only valid BPM values > 0
-                    if valid_bpms:
-                        min_bpm = max(40, min(valid_bpms) - 10)
-                        max_bpm = min(220, max(valid_bpms) + 10)
+                    if valid_bpms.size:
+                        min_bpm = max(40, valid_bpms.min() - 10)
+                        max_bpm = min(220, valid_bpms.max() + 10)
                         self.ax_mic.set_ylim(min_bpm, max_bpm)
                 
                 # Set x-axis limits to keep start point at the left but dynamically expand right side
-                max_time = max(times)
+                max_time = times.max()
                 if max_time < 5:  # Initial window when just starting
                     self.ax_mic.set_xlim(0, 5)
                 else:
@@ -1976,7 +2528,7 @@ class BPMGUIApp:
                 self.ax_mic.text(0.5, 0.5, "Microphone active. Analyzing initial audio...",
                                 ha='center', va='center', transform=self.ax_mic.transAxes,
                                 color='gray', style='italic')
-            elif not times or not bpms:
+            elif not times.size:
                 self.ax_mic.set_ylim(40, 220)
                 self.ax_mic.set_xlim(0, 5)
             
@@ -1984,7 +2536,7 @@ class BPMGUIApp:
             self.ax_mic.grid(True, alpha=0.3)
             
             # Only add legend if we have valid data to display
-            if times and bpms and len(bpms) > 1 or (len(bpms) == 1 and bpms[0] > 0):
+            if len(bpms) > 1 or (len(bpms) == 1 and bpms[0] > 0):
                 # Check if there are any elements with labels to show in the legend
                 if any(line.get_label() not in ("_nolegend_", "") for line in self.ax_mic.get_lines()):
                     self.ax_mic.legend(loc='upper right')
@@ -2016,34 +2568,10 @@ class BPMGUIApp:
         bpm_percent_diff = (bpm_diff / self.reference_bpm) * 100
         
         # Determine similarity level
-        if bpm_percent_diff < 2:
-            similarity = "Perfect Match"
-            color = "green"
-            feedback = "Excellent timing! You're perfectly in sync."
-        elif bpm_percent_diff < 5:
-            similarity = "Very Good Match"
-            color = "#4CAF50"  # Darker green
-            feedback = "Great job! Your timing is very close."
-        elif bpm_percent_diff < 10:
-            similarity = "Good Match"
-            color = "#8BC34A"  # Light green
-            feedback = "Good timing. Slight adjustments could make it perfect."
-        elif bpm_percent_diff < 15:
-            similarity = "Fair Match"
-            color = "#FFC107"  # Yellow
-            feedback = "Decent timing. Try to [speed up/slow down] to match better."
-            if mic_bpm < self.reference_bpm:
-                feedback = feedback.replace("[speed up/slow down]", "speed up")
-            else:
-                feedback = feedback.replace("[speed up/slow down]", "slow down")
-        else:
-            similarity = "Not Well Matched"
-            color = "#F44336"  # Red
-            feedback = "Significant timing difference. Try to [speed up/slow down] considerably."
-            if self.mic_bpm < self.reference_bpm:
-                feedback = feedback.replace("[speed up/slow down]", "speed up")
-            else:
-                feedback = feedback.replace("[speed up/slow down]", "slow down")
+        similarity, color, feedback = _MATCH_LEVELS[bisect.bisect_right(_MATCH_BREAKS, bpm_percent_diff)]
+        if "[speed up/slow down]" in feedback:
+            direction = "speed up" if mic_bpm < self.reference_bpm else "slow down"
+            feedback = feedback.replace("[speed up/slow down]", direction)
         
         # Update comparison label
         comparison_text = f"{similarity} ({bpm_diff:.1f} BPM difference)"
@@ -2354,7 +2882,7 @@ class BPMGUIApp:
         if valid_times and valid_bpms:
             # Top: real-time microphone BPM + reference + mean + faster/slower fill (extracted)
             sheet_bpm = metrics['reference_bpm']
-            ref_series = plot_bpm_timeseries(
+            ref_series, valid_bpms_np = plot_bpm_timeseries(
                 ax_ts,
                 valid_times=valid_times,
                 valid_bpms=valid_bpms,
@@ -2362,15 +2890,18 @@ class BPMGUIApp:
                 reference_pairs=getattr(self, 'time_bpm_pairs', None)
             )
 
+            # Convert once and compute Mic - Reference once for the remaining plots
+            times_np, mic_np, ref_np, dev_np = prepare_plot_arrays(valid_times, valid_bpms_np, ref_series)
+
             # Distributions: violin and box plots (extracted)
-            plot_distributions(ax_violin, ax_box, valid_bpms, ref_series)
+            plot_distributions(ax_violin, ax_box, mic_np, ref_np, deviations=dev_np)
             
             # Heatmap: segment-wise tempo deviation (%) — extracted to bpm_visuals module
             im = plot_deviation_heatmap(
                 ax_heatmap,
-                valid_times=valid_times,
-                valid_bpms=valid_bpms,
-                ref_series=ref_series,
+                valid_times=times_np,
+                valid_bpms=mic_np,
+                ref_series=ref_np,
                 sheet_bpm=sheet_bpm,
                 segment_count=8
             )
@@ -2384,7 +2915,6 @@ class BPMGUIApp:
             # Removed divider line between top time series and lower plots
             
             # Embed plot in a vertically scrollable Tkinter container
-            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
             scroll_container = ttk.Frame(visual_tab)
             scroll_container.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
             tk_canvas = tk.Canvas(scroll_container, highlightthickness=0)
@@ -2474,7 +3004,6 @@ class BPMGUIApp:
         def request_thread():
             try:
                 instruction = build_prompt()
-                import os, json, urllib.request, urllib.error
                 api_key = os.environ.get('DEEPSEEK_API_KEY')
                 if not api_key:
                     # Fallback to project config.json
@@ -2505,30 +3034,18 @@ class BPMGUIApp:
                     ],
                     "stream": False
                 }
-                data = json.dumps(payload).encode('utf-8')
-                req = urllib.request.Request(url, data=data, method='POST')
-                req.add_header('Authorization', f'Bearer {api_key}')
-                req.add_header('Content-Type', 'application/json')
-
-                # Use certifi CA bundle to avoid SSL certificate verify failures on macOS
                 try:
-                    import ssl, certifi
-                    ssl_context = ssl.create_default_context(cafile=certifi.where())
-                except Exception:
-                    import ssl
-                    ssl_context = ssl.create_default_context()
-
-                try:
-                    with urllib.request.urlopen(req, timeout=180, context=ssl_context) as resp:
-                        body = resp.read().decode('utf-8')
-                except urllib.error.HTTPError as e:
-                    try:
-                        body = e.read().decode('utf-8', 'ignore')
-                    except Exception:
-                        body = ''
-                    raise Exception(f"HTTP {e.code}: {body}")
-                except urllib.error.URLError as e:
-                    raise Exception(f"Network error: {getattr(e, 'reason', e)}")
+                    resp = self._http.post(
+                        url,
+                        json=payload,
+                        headers={'Authorization': f'Bearer {api_key}'},
+                        timeout=(5, 180)
+                    )
+                except requests.exceptions.RequestException as e:
+                    raise Exception(f"Network error: {e}")
+                body = resp.text
+                if resp.status_code >= 400:
+                    raise Exception(f"HTTP {resp.status_code}: {body}")
                 result = json.loads(body)
                 msg = result.get('choices', [{}])[0].get('message', {})
                 content = msg.get('content', '')
@@ -2543,7 +3060,7 @@ class BPMGUIApp:
                         summary_text_widget.insert(tk.END, "\n\nAI Feedback (DeepSeek)\n\n")
                         # Full Markdown rendering: headings, bold/italic, inline code, code blocks,
                         # lists (ordered/unordered with indentation), blockquotes, horizontal rules, links.
-                        import re, webbrowser
+                        import webbrowser
                         def insert_markdown(widget, md):
                             # Tag setup
                             try:
@@ -2566,164 +3083,30 @@ class BPMGUIApp:
                                 pass
 
                             link_counter = 0
-
-                            def apply_inline(text):
-                                # Returns list of (segment_text, tags, extra)
-                                segments = []
-                                i = 0
-                                while i < len(text):
-                                    # Links: [text](url)
-                                    m = re.search(r"\[([^\]]+)\]\(([^)]+)\)", text[i:])
-                                    if m:
-                                        pre = text[i:i+m.start()]
-                                        if pre:
-                                            segments.append((pre, [], None))
-                                        link_text = m.group(1)
-                                        link_url = m.group(2)
-                                        segments.append((link_text, ['link'], link_url))
-                                        i += m.end()
-                                        continue
-                                    # Inline code: `code`
-                                    m = re.search(r"`([^`]+)`", text[i:])
-                                    if m:
-                                        pre = text[i:i+m.start()]
-                                        if pre:
-                                            segments.append((pre, [], None))
-                                        code_text = m.group(1)
-                                        segments.append((code_text, ['code'], None))
-                                        i += m.end()
-                                        continue
-                                    # Bold: **text** or __text__
-                                    m = re.search(r"\*\*([^*]+)\*\*|__([^_]+)__", text[i:])
-                                    if m:
-                                        pre = text[i:i+m.start()]
-                                        if pre:
-                                            segments.append((pre, [], None))
-                                        bold_text = m.group(1) if m.group(1) is not None else m.group(2)
-                                        segments.append((bold_text, ['bold'], None))
-                                        i += m.end()
-                                        continue
-                                    # Italic: *text* or _text_
-                                    m = re.search(r"(?<!\*)\*([^*]+)\*(?!\*)|(?<!_)_([^_]+)_", text[i:])
-                                    if m:
-                                        pre = text[i:i+m.start()]
-                                        if pre:
-                                            segments.append((pre, [], None))
-                                        italic_text = m.group(1) if m.group(1) is not None else m.group(2)
-                                        segments.append((italic_text, ['italic'], None))
-                                        i += m.end()
-                                        continue
-                                    # No more markup
-                                    segments.append((text[i:], [], None))
-                                    break
-                                return segments
-
-                            # Create per-link tags with click behavior
-                            def insert_with_tags(line_text, base_tag=None):
-                                nonlocal link_counter
-                                segments = apply_inline(line_text)
-                                start_index = widget.index(tk.END)
-                                for seg_text, tags, extra in segments:
-                                    segment_start = widget.index(tk.END)
-                                    widget.insert(tk.END, seg_text)
-                                    applied_tags = []
-                                    if base_tag:
-                                        applied_tags.append(base_tag)
-                                    for t in tags:
-                                        if t == 'link':
-                                            tag_name = f"link_{link_counter}"
-                                            link_counter += 1
+                            for seg_text, tags, link in _parse_markdown(md):
+                                segment_start = widget.index(tk.END)
+                                widget.insert(tk.END, seg_text)
+                                applied_tags = list(tags)
+                                if link is not None:
+                                    # Create per-link tags with click behavior
+                                    tag_name = f"link_{link_counter}"
+                                    link_counter += 1
+                                    try:
+                                        widget.tag_configure(tag_name, foreground='blue', underline=True)
+                                        def _open(url=link):
                                             try:
-                                                widget.tag_configure(tag_name, foreground='blue', underline=True)
-                                                def _open(url=extra):
-                                                    try:
-                                                        webbrowser.open(url)
-                                                    except Exception:
-                                                        pass
-                                                widget.tag_bind(tag_name, '<Button-1>', lambda e, f=_open: f())
+                                                webbrowser.open(url)
                                             except Exception:
                                                 pass
-                                            applied_tags.append(tag_name)
-                                        else:
-                                            applied_tags.append(t)
-                                    for t in applied_tags:
-                                        try:
-                                            widget.tag_add(t, segment_start, widget.index(tk.END))
-                                        except Exception:
-                                            pass
-                                widget.insert(tk.END, "\n")
-
-                            # Parse block-level elements
-                            lines = md.splitlines()
-                            in_codeblock = False
-                            codeblock_buffer = []
-                            for raw in lines:
-                                line = raw.rstrip('\n')
-                                if in_codeblock:
-                                    if line.strip().startswith('```'):
-                                        # Flush code block
-                                        code_text = "\n".join(codeblock_buffer) + "\n"
-                                        start = widget.index(tk.END)
-                                        widget.insert(tk.END, code_text)
-                                        try:
-                                            widget.tag_add('codeblock', start, widget.index(tk.END))
-                                        except Exception:
-                                            pass
-                                        codeblock_buffer = []
-                                        in_codeblock = False
-                                    else:
-                                        codeblock_buffer.append(line)
-                                    continue
-
-                                # Start code block
-                                if line.strip().startswith('```'):
-                                    in_codeblock = True
-                                    codeblock_buffer = []
-                                    continue
-
-                                if not line.strip():
-                                    widget.insert(tk.END, "\n")
-                                    continue
-
-                                # Headings
-                                m = re.match(r"^(#{1,6})\s+(.*)$", line)
-                                if m:
-                                    level = len(m.group(1))
-                                    text = m.group(2)
-                                    tag = f"h{level}"
-                                    insert_with_tags(text, base_tag=tag)
-                                    continue
-
-                                # Horizontal rule
-                                if re.match(r"^\s*(\*{3,}|-{3,}|_{3,})\s*$", line):
-                                    widget.insert(tk.END, "-" * 80 + "\n")
-                                    continue
-
-                                # Blockquote
-                                if re.match(r"^>\s?(.*)$", line):
-                                    quote_text = re.sub(r"^>\s?", "", line)
-                                    insert_with_tags(quote_text, base_tag='quote')
-                                    continue
-
-                                # Lists (unordered and ordered), with indentation
-                                lm = re.match(r"^(\s*)([-*+]\s+)(.*)$", line)
-                                om = re.match(r"^(\s*)(\d+\.\s+)(.*)$", line)
-                                if lm or om:
-                                    indent = len((lm or om).group(1)) // 2
-                                    indent_tag = 'list1' if indent == 1 else ('list2' if indent == 2 else ('list3' if indent >= 3 else None))
-                                    bullet = '• ' if lm else (om.group(2))
-                                    content_text = (lm or om).group(3)
-                                    insert_with_tags(bullet + content_text, base_tag=indent_tag)
-                                    continue
-
-                                # Tables: simple pipe-delimited rows
-                                if '|' in line:
-                                    # Render as monospaced row
-                                    insert_with_tags(line.replace('|', ' | '), base_tag='code')
-                                    continue
-
-                                # Paragraph
-                                insert_with_tags(line)
+                                        widget.tag_bind(tag_name, '<Button-1>', lambda e, f=_open: f())
+                                    except Exception:
+                                        pass
+                                    applied_tags.append(tag_name)
+                                for t in applied_tags:
+                                    try:
+                                        widget.tag_add(t, segment_start, widget.index(tk.END))
+                                    except Exception:
+                                        pass
 
                         insert_markdown(summary_text_widget, content.strip())
                         summary_text_widget.config(state=tk.DISABLED)
@@ -2739,7 +3122,6 @@ class BPMGUIApp:
             summary_text_widget.config(state=tk.DISABLED)
         except Exception:
             pass
-        import threading
         threading.Thread(target=request_thread, daemon=True).start()
 
     def show_mic_bpm_timeseries(self):
@@ -2878,14 +3260,15 @@ class BPMGUIApp:
         tree.heading("time", text="Time (min:sec)")
         tree.heading("bpm", text="BPM")
         
-        # Fill data
-        for time_seconds, bpm in self.time_bpm_pairs:
-            # Convert seconds to min:sec format
-            minutes = int(time_seconds // 60)
-            seconds = int(time_seconds % 60)
-            time_str = f"{minutes:02d}:{seconds:02d}"
-            # Add to table
-            tree.insert("", tk.END, values=(time_str, round(bpm, 1)))
+        # Fill data: convert seconds to min:sec format and round BPM for all
+        # rows at once, then insert with the method lookup hoisted out of the loop
+        minutes = (self._times // 60).astype(int).tolist()
+        seconds = (self._times % 60).astype(int).tolist()
+        bpms = np.round(self._bpms, 1).tolist()
+        rows = [(f"{m:02d}:{sec:02d}", b) for m, sec, b in zip(minutes, seconds, bpms)]
+        insert = tree.insert
+        for row in rows:
+            insert("", tk.END, values=row)
         
         tree.pack(fill=tk.BOTH, expand=True)
         
@@ -2918,17 +3301,12 @@ class BPMGUIApp:
         Returns:
             Configured label widget
         """
-        if not hasattr(self, 'time_bpm_pairs') or not self.time_bpm_pairs:
+        stats = self._bpm_stats()
+        if stats is None:
             return ttk.Label(parent, text="No statistics available")
         
-        # Extract all BPM values
-        bpm_values = [bpm for _, bpm in self.time_bpm_pairs]
-        
-        # Calculate statistics
-        avg_bpm = np.mean(bpm_values)
-        min_bpm = np.min(bpm_values)
-        max_bpm = np.max(bpm_values)
-        std_bpm = np.std(bpm_values)
+        # Statistics cached when the series was analyzed
+        avg_bpm, min_bpm, max_bpm, std_bpm = stats
         
         # Create statistics text
         stats_text = f"Statistics: Average BPM = {avg_bpm:.1f}, Minimum BPM = {min_bpm:.1f}, Maximum BPM = {max_bpm:.1f}, Standard Deviation = {std_bpm:.1f}"
@@ -2954,19 +3332,16 @@ class BPMGUIApp:
             if not file_path:
                 return  # User cancelled operation
             
-            # Write to CSV file
-            import csv
-            with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
+            # Write to CSV file through a large buffer
+            with open(file_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
                 csv_writer = csv.writer(csvfile)
                 # Write header
                 csv_writer.writerow(["Time (seconds)", "Time (min:sec)", "BPM"])
-                # Write data
-                for time_seconds, bpm in self.time_bpm_pairs:
-                    # Convert seconds to min:sec format
-                    minutes = int(time_seconds // 60)
-                    seconds = int(time_seconds % 60)
-                    time_str = f"{minutes:02d}:{seconds:02d}"
-                    csv_writer.writerow([time_seconds, time_str, round(bpm, 1)])
+                # Write data in one call, converting seconds to min:sec format
+                csv_writer.writerows(
+                    (t, f"{int(t // 60):02d}:{int(t % 60):02d}", round(b, 1))
+                    for t, b in zip(self._times.tolist(), self._bpms.tolist())
+                )
             
             messagebox.showinfo("Success", f"BPM data successfully exported to:\n{file_path}")
             
@@ -2993,16 +3368,14 @@ class BPMGUIApp:
             )
             if not file_path:
                 return
-            import csv
-            with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
+            with open(file_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
                 writer = csv.writer(csvfile)
                 writer.writerow(["Time (seconds)", "Time (min:sec)", "Mic BPM"])
-                for time_seconds, bpm in pairs:
-                    minutes = int(time_seconds // 60)
-                    seconds = int(time_seconds % 60)
-                    time_str = f"{minutes:02d}:{seconds:02d}"
-                    bpm_out = round(float(bpm), 1) if isinstance(bpm, (int, float)) and float(bpm) > 0 else "--"
-                    writer.writerow([time_seconds, time_str, bpm_out])
+                writer.writerows(
+                    (t, f"{int(t // 60):02d}:{int(t % 60):02d}",
+                     round(float(bpm), 1) if isinstance(bpm, (int, float)) and float(bpm) > 0 else "--")
+                    for t, bpm in pairs
+                )
             messagebox.showinfo("Success", f"Microphone BPM data successfully exported to:\n{file_path}")
         except Exception as e:
             messagebox.showerror("Error", f"Error exporting microphone BPM data:\n{str(e)}")
@@ -3027,6 +3400,8 @@ class BPMGUIApp:
         self.playing = False
         self.mic_recording = False
         self.comparison_active = False
+        self.root.after_cancel(self._tick_ui_id)
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
         
         # Stop playback
         if pygame.mixer.get_init():
@@ -3034,10 +3409,10 @@ class BPMGUIApp:
             pygame.mixer.quit()
         
         # Remove temporary files
-        if hasattr(self, 'temp_wav_file') and self.temp_wav_file and os.path.exists(self.temp_wav_file):
+        for temp_file in self._temp_files:
             try:
-                os.remove(self.temp_wav_file)
-            except:
+                os.remove(temp_file)
+            except OSError:
                 pass
         if hasattr(self, 'temp_mic_wav_file') and self.temp_mic_wav_file and os.path.exists(self.temp_mic_wav_file):
             try:
@@ -3055,6 +3430,15 @@ class BPMGUIApp:
             except:
                 pass
         
+        # Drop cached Markdown renders
+        _parse_markdown.cache_clear()
+        
+        # Release pooled HTTP connections
+        try:
+            self._http.close()
+        except Exception:
+            pass
+        
         # Destroy window
         self.root.destroy()
 
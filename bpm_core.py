@@ -1,6 +1,159 @@
+import os
+import bisect
+import functools
+import queue
+import struct
+import threading
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from pydub import AudioSegment
 from scipy import signal
+import scipy.fft
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import soundfile as sf
+except ImportError:  # soundfile is optional; pydub decodes everything instead
+    sf = None
+
+try:
+    import audioread
+except ImportError:  # audioread is optional; pydub decodes compressed formats instead
+    audioread = None
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the NumPy path below is used instead
+    njit = None
+
+# Upper bound (bytes) on the windowed-frame block transformed per FFT call,
+# so spectral flux memory stays constant regardless of track length
+_MAX_MEM_BLOCK = 2**20
+
+@functools.lru_cache(maxsize=8)
+def _decimation_filter(q):
+    """
+    Short linear-phase low-pass FIR for decimating by q; it only has to keep
+    aliasing out of the energy/flux envelopes, not preserve audio fidelity
+    """
+    return signal.firwin(8 * q + 1, 0.9 / q).astype(np.float32)
+
+
+# An octave (or third) of the strongest tempo replaces it when its pooled
+# autocorrelation reaches this share of the peak (see _fold_tempo_octave)
+_OCTAVE_MIN_STRENGTH = 0.7
+
+
+# Lower BPM bound of each category above the slowest; _BPM_LABELS[i] covers
+# _BPM_BREAKS[i - 1] <= bpm < _BPM_BREAKS[i]
+_BPM_BREAKS = (70, 90, 110, 130, 150, 175, 200)
+_BPM_LABELS = (
+    "Very Slow (Ambient, Doom Metal)",
+    "Slow (Ballads, Reggae)",
+    "Moderately Slow (Hip Hop, R&B)",
+    "Medium (Pop, Rock, EDM)",
+    "Moderately Fast (House, Techno)",
+    "Fast (Trance, Hardstyle)",
+    "Very Fast (Drum & Bass, Gabber)",
+    "Extremely Fast (Electronic Hardcore)",
+)
+
+# Precompiled RIFF/WAV header layouts
+_CHUNK_HEADER = struct.Struct('<4sI')
+_FMT_CHUNK = struct.Struct('<HHIIHH')
+_U16_LE = struct.Struct('<H')
+
+
+def _decode_u8(data):
+    # 8-bit WAV is unsigned; re-centre in the float32 buffer
+    samples = np.frombuffer(data, dtype=np.uint8).astype(np.float32)
+    samples -= np.float32(128)
+    return samples
+
+
+def _decode_s16(data):
+    return np.frombuffer(data, dtype='<i2').astype(np.float32)
+
+
+def _decode_s24(data):
+    # Place each little-endian 24-bit sample in the top three bytes of an
+    # int32; the arithmetic shift back down sign-extends it
+    raw = np.frombuffer(data, dtype=np.uint8)
+    buf = np.zeros((len(raw) // 3, 4), dtype=np.uint8)
+    buf[:, 1:] = raw[:len(buf) * 3].reshape(-1, 3)
+    ints = buf.view('<i4').ravel()
+    np.right_shift(ints, 8, out=ints)
+    return ints.astype(np.float32)
+
+
+def _decode_s32(data):
+    return np.frombuffer(data, dtype='<i4').astype(np.float32)
+
+
+def _read_wav_header(f):
+    """
+    Walk the RIFF chunks of an open WAV file up to the start of its sample data
+    
+    Reads strictly forward (unknown chunks are skipped with a relative seek),
+    so the OS readahead for the header carries straight on into the samples.
+    
+    Parameters:
+        f: Binary file object positioned at the start of the file
+        
+    Returns:
+        Tuple of (n_channels, sample_rate, sample_width, data_size) with f left at
+        the first sample, or None if the file is not an integer PCM WAV
+    """
+    riff = f.read(12)
+    if len(riff) < 12 or riff[:4] != b'RIFF' or riff[8:12] != b'WAVE':
+        return None
+    
+    fmt = None
+    while True:
+        chunk = f.read(_CHUNK_HEADER.size)
+        if len(chunk) < _CHUNK_HEADER.size:
+            return None
+        chunk_id, chunk_size = _CHUNK_HEADER.unpack(chunk)
+        if chunk_id == b'data':
+            break
+        # Chunks are padded to an even size
+        padded_size = chunk_size + (chunk_size & 1)
+        if chunk_id == b'fmt ':
+            fmt = f.read(padded_size)
+        else:
+            f.seek(padded_size, 1)
+    
+    if fmt is None or len(fmt) < _FMT_CHUNK.size:
+        return None
+    format_tag, n_channels, sample_rate, _, _, bits_per_sample = _FMT_CHUNK.unpack_from(fmt, 0)
+    if format_tag == 0xFFFE and len(fmt) >= 26:
+        # WAVE_FORMAT_EXTENSIBLE: the actual format tag leads the SubFormat GUID
+        format_tag, = _U16_LE.unpack_from(fmt, 24)
+    if format_tag != 1 or n_channels == 0 or sample_rate == 0:
+        return None
+    return n_channels, sample_rate, (bits_per_sample + 7) // 8, chunk_size
+
+
+# PCM WAV decoders by sample width in bytes; each returns interleaved float32
+# samples at the file's integer scale (the loader peak-normalizes afterwards)
+_WAV_DECODERS = {1: _decode_u8, 2: _decode_s16, 3: _decode_s24, 4: _decode_s32}
+
+
+if njit is not None:
+    @njit(fastmath=True, cache=True, nogil=True)
+    def _flux_kernel(mag, out):
+        """
+        Positive spectral difference energy between consecutive rows of mag,
+        one fused pass (subtract, clip, square, sum) per row pair
+        """
+        for i in range(mag.shape[0] - 1):
+            acc = np.float32(0.0)
+            for j in range(mag.shape[1]):
+                d = mag[i + 1, j] - mag[i, j]
+                acc += d * d if d > 0 else np.float32(0.0)
+            out[i] = acc
+else:
+    _flux_kernel = None
 
 class BPMAnalyzer:
     def __init__(self, frame_size=2048, hop_size=512):
@@ -19,20 +172,46 @@ class BPMAnalyzer:
         self.bpm_smoothing_window = 3  # Moving average window size
         # Spectral flux threshold for better beat detection
         self.spectral_flux_threshold = 0.15
+        # Tempo estimator: 'autocorrelation' of the onset envelope, or
+        # 'intervals' for voting over detected beat intervals
+        self.tempo_method = 'autocorrelation'
+        # Onset envelopes need no more bandwidth than this; faster input is
+        # decimated by an integer factor first (None to analyze at full rate)
+        self.analysis_rate = 11025
+        self._low_rate_analyzers = {}
+        # Analysis window, built once and broadcast over all frames
+        self._hann = np.hanning(frame_size).astype(np.float32)
+        # FFT length padded to pocketfft's fastest size class (no-op for powers of two)
+        self._fft_n = scipy.fft.next_fast_len(frame_size, real=True)
+        # Work buffers reused across segments; per thread, since segments of
+        # one file are analyzed concurrently on the same analyzer
+        self._scratch_local = threading.local()
     
-    def analyze_audio_data(self, audio_data, sample_rate):
+    def analyze_audio_data(self, audio_data, sample_rate, assume_normalized=False):
         """
         Analyze audio data to detect beats and calculate BPM
         
         Parameters:
             audio_data: 1D numpy array of audio samples
             sample_rate: Audio sample rate
+            assume_normalized: Caller guarantees float32 samples already scaled to peak 1
             
         Returns:
             Detected BPM value
         """
+        q = int(sample_rate // self.analysis_rate) if self.analysis_rate else 1
+        if q >= 2:
+            # Same analysis on a quarter (or less) of the data: low-pass and
+            # decimate, then use frame/hop sizes scaled to the same durations
+            audio_data = signal.upfirdn(_decimation_filter(q), np.asarray(audio_data, dtype=np.float32), down=q)
+            return self._low_rate_analyzer(q).analyze_audio_data(audio_data, sample_rate / q)
+        
+        if self.tempo_method == 'autocorrelation':
+            onset = self._onset_envelope(audio_data, sample_rate, assume_normalized)
+            return self._estimate_tempo_autocorr(onset, sample_rate)
+        
         # Detect beats using improved algorithm
-        beats = self._detect_beats_improved(audio_data, sample_rate)
+        beats = self._detect_beats_improved(audio_data, sample_rate, assume_normalized)
         
         if not beats:
             return 0
@@ -54,109 +233,318 @@ class BPMAnalyzer:
         
         return np.mean(filtered_bpm)
     
-    def _detect_beats_improved(self, audio_data, sample_rate):
+    def _low_rate_analyzer(self, q):
         """
-        Improved beat detection using spectral flux, energy, and onset detection
+        Analyzer for audio decimated by q, sharing this analyzer's settings
+        
+        Parameters:
+            q: Integer decimation factor
+            
+        Returns:
+            BPMAnalyzer with frame and hop sizes divided by q
+        """
+        analyzer = self._low_rate_analyzers.get(q)
+        if analyzer is None:
+            analyzer = BPMAnalyzer(self.frame_size // q, self.hop_size // q)
+            analyzer.analysis_rate = None
+            self._low_rate_analyzers[q] = analyzer
+        analyzer.beat_threshold_multiplier = self.beat_threshold_multiplier
+        analyzer.bpm_smoothing_window = self.bpm_smoothing_window
+        analyzer.spectral_flux_threshold = self.spectral_flux_threshold
+        analyzer.tempo_method = self.tempo_method
+        return analyzer
+    
+    def _onset_envelope(self, audio_data, sample_rate, assume_normalized=False):
+        """
+        Onset strength per frame from energy and spectral flux
         
         Parameters:
             audio_data: 1D numpy array of audio samples
             sample_rate: Audio sample rate
+            assume_normalized: Skip the peak scan for samples already scaled to peak 1
             
         Returns:
-            List of beat timestamps in seconds
+            float32 array with one onset value per frame
         """
-        # Normalize audio data
-        audio_data = audio_data / np.max(np.abs(audio_data))
-        
-        # Calculate energy envelope (root mean square per frame)
-        energy = []
-        for i in range(0, len(audio_data) - self.frame_size, self.hop_size):
-            frame = audio_data[i:i + self.frame_size]
-            energy.append(np.sqrt(np.mean(frame**2)))
+        if assume_normalized:
+            audio_data = np.asarray(audio_data, dtype=np.float32)
+        else:
+            # Normalize audio data into a float32 working copy (callers may pass
+            # overlapping views of one buffer, so never scale their array in place)
+            audio_data = self._scale_to_peak(np.array(audio_data, dtype=np.float32))
         
-        # Calculate spectral flux (change in frequency domain)
-        spectral_flux = self._calculate_spectral_flux(audio_data, sample_rate)
+        # Energy and spectral flux envelopes from one pass over the frames
+        frames = self._frame_audio(audio_data)
+        energy, spectral_flux = self._envelopes_from_frames(frames)
         
         # Combine energy and spectral flux for better beat detection
-        # Ensure both arrays have the same length
+        # Ensure both arrays have the same length; both are float32, and so is
+        # the combined envelope, keeping the threshold/peak scans 8 lanes wide
         min_length = min(len(energy), len(spectral_flux))
-        combined_onset = 0.7 * np.array(energy[:min_length]) + 0.3 * np.array(spectral_flux[:min_length])
+        combined_onset = 0.7 * energy[:min_length]
+        combined_onset += 0.3 * spectral_flux[:min_length]
         
-        # Calculate dynamic threshold using a moving window
-        window_size = 30  # ~0.3 seconds at typical sample rates
-        dynamic_threshold = []
+        return combined_onset
+    
+    def _estimate_tempo_autocorr(self, onset, sample_rate):
+        """
+        Estimate tempo from the autocorrelation of the onset envelope
         
-        for i in range(len(combined_onset)):
-            start_idx = max(0, i - window_size)
-            end_idx = min(len(combined_onset), i + 1)
-            local_mean = np.mean(combined_onset[start_idx:end_idx])
-            local_std = np.std(combined_onset[start_idx:end_idx]) if end_idx > start_idx else 0
+        Parameters:
+            onset: 1D array of onset strength per frame
+            sample_rate: Audio sample rate
             
-            # Adaptive threshold based on local statistics
-            threshold = local_mean + self.beat_threshold_multiplier * local_std
-            dynamic_threshold.append(threshold)
-        
-        # Find peaks that exceed the dynamic threshold
-        beats = []
-        for i in range(1, len(combined_onset) - 1):
-            # Peak condition: higher than neighbors and above threshold
-            is_peak = (combined_onset[i] > combined_onset[i-1] and 
-                      combined_onset[i] > combined_onset[i+1] and 
-                      combined_onset[i] > dynamic_threshold[i])
+        Returns:
+            BPM at the strongest periodicity in the 40-220 BPM range, folded
+            into 60-180 BPM when the octave there is nearly as strong, or 0
+        """
+        # Map the BPM range to a lag range in frames
+        fps = sample_rate / self.hop_size
+        lag_lo = max(1, int(60 * fps / 220))
+        lag_hi = min(len(onset) - 1, int(60 * fps / 40))
+        # No periodicity to find in a too-short or flat envelope
+        if lag_hi < lag_lo or np.ptp(onset) == 0:
+            return 0
+        
+        # All lag energies at once with a single FFT-based correlation
+        onset = onset - np.mean(onset)
+        ac = signal.fftconvolve(onset, onset[::-1], mode='full')[len(onset) - 1:]
+        # A fractional beat period splits its peak over two neighbouring lags;
+        # pool each lag with its neighbours before comparing periodicities
+        pooled = np.convolve(ac, np.ones(3), mode='same')
+        
+        best_lag = lag_lo + int(np.argmax(pooled[lag_lo:lag_hi + 1]))
+        best_lag = self._fold_tempo_octave(pooled, best_lag, fps, lag_lo, lag_hi)
+        return 60 * fps / self._refine_period(ac, best_lag)
+    
+    def _fold_tempo_octave(self, pooled, lag, fps, lag_lo, lag_hi):
+        """
+        Resolve octave errors: click-like onsets correlate about as well at
+        two or three beat periods as at one, so the raw peak can land on half
+        or a third of the tempo
+        
+        Parameters:
+            pooled: Neighbour-pooled autocorrelation of the onset envelope
+            lag: Lag of the strongest periodicity, in frames
+            fps: Onset frames per second
+            lag_lo, lag_hi: Searched lag range
             
-            if is_peak:
-                # Convert frame index to time in seconds
-                beat_time = i * self.hop_size / sample_rate
-                beats.append(beat_time)
+        Returns:
+            Lag of the fastest nearly-as-strong reading at or below 180 BPM
+            (within one frame), else the input lag
+        """
+        # Fastest preferred tempo as a lag, with one frame of slack for rounding
+        fast_lag = 60 * fps / 180 - 1
+        # Faster readings first: a third or a half of the lag, if not above 180 BPM
+        for divisor in (3, 2):
+            cand = int(round(lag / divisor))
+            if cand - 1 >= lag_lo and cand >= fast_lag:
+                cand = cand - 1 + int(np.argmax(pooled[cand - 1:cand + 2]))
+                if pooled[cand] >= _OCTAVE_MIN_STRENGTH * pooled[lag]:
+                    return cand
+        # Slower reading for a peak above 180 BPM: twice the lag
+        cand = 2 * lag
+        if lag < fast_lag and cand + 1 <= lag_hi:
+            cand = cand - 1 + int(np.argmax(pooled[cand - 1:cand + 2]))
+            if pooled[cand] >= _OCTAVE_MIN_STRENGTH * pooled[lag]:
+                return cand
+        return lag
+    
+    def _refine_period(self, ac, lag):
+        """
+        Beat period in fractional frames: interpolate the autocorrelation
+        peaks at one to four periods and divide by the multiple, so the
+        estimate is not limited to whole-frame lags
         
-        # Remove very closely spaced beats (likely duplicates)
-        refined_beats = []
+        Parameters:
+            ac: Autocorrelation of the onset envelope
+            lag: Beat period rounded to whole frames
+            
+        Returns:
+            Beat period in frames
+        """
+        period = float(lag)
+        for multiple in (1, 2, 3, 4):
+            center = int(round(multiple * period))
+            if center < 2 or center + 2 >= len(ac):
+                break
+            peak = center - 1 + int(np.argmax(ac[center - 1:center + 2]))
+            # Parabolic vertex through the peak and its neighbours
+            y0, y1, y2 = ac[peak - 1], ac[peak], ac[peak + 1]
+            curvature = y0 - 2 * y1 + y2
+            offset = 0.5 * (y0 - y2) / curvature if curvature < 0 else 0.0
+            period = (peak + offset) / multiple
+        return period
+    
+    def _detect_beats_improved(self, audio_data, sample_rate, assume_normalized=False):
+        """
+        Improved beat detection using spectral flux, energy, and onset detection
+        
+        Parameters:
+            audio_data: 1D numpy array of audio samples
+            sample_rate: Audio sample rate
+            assume_normalized: Skip the peak scan for samples already scaled to peak 1
+            
+        Returns:
+            List of beat timestamps in seconds
+        """
+        combined_onset = self._onset_envelope(audio_data, sample_rate, assume_normalized)
+        
+        # Calculate dynamic threshold using a moving window
+        window_size = 30  # ~0.3 seconds at typical sample rates
+        dynamic_threshold = self._dynamic_threshold(combined_onset, window_size)
+        
+        # Find peaks above the dynamic threshold that are more than the
+        # minimum beat interval apart (closer ones are likely duplicates;
+        # the stronger peak is kept)
         min_beat_interval = 0.05  # Minimum 50ms between beats
+        fps = sample_rate / self.hop_size
+        peak_idx, _ = signal.find_peaks(combined_onset, height=dynamic_threshold,
+                                        distance=int(min_beat_interval * fps) + 1)
         
-        for beat in beats:
-            if not refined_beats or beat - refined_beats[-1] > min_beat_interval:
-                refined_beats.append(beat)
+        # Convert frame indices to time in seconds
+        return (peak_idx * (self.hop_size / sample_rate)).tolist()
+    
+    def _dynamic_threshold(self, combined_onset, window_size):
+        """
+        Adaptive beat threshold from local onset statistics
         
-        return refined_beats
+        Parameters:
+            combined_onset: 1D array of onset strength per frame
+            window_size: Number of preceding frames in the threshold window
+            
+        Returns:
+            float32 array of threshold values, one per frame
+        """
+        # Sliding mean/std over combined_onset[i - window_size : i + 1] from cumulative sums
+        idx = np.arange(len(combined_onset))
+        start_idx = np.maximum(0, idx - window_size)
+        count = idx + 1 - start_idx
+        c1 = np.concatenate(([0.0], np.cumsum(combined_onset, dtype=np.float64)))
+        c2 = np.concatenate(([0.0], np.cumsum(np.square(combined_onset, dtype=np.float64))))
+        local_mean = (c1[idx + 1] - c1[start_idx]) / count
+        local_var = (c2[idx + 1] - c2[start_idx]) / count - local_mean * local_mean
+        local_std = np.sqrt(np.maximum(local_var, 0.0))
+        
+        # Accumulated in float64, compared in float32 like the onset envelope
+        return (local_mean + self.beat_threshold_multiplier * local_std).astype(np.float32)
     
-    def _calculate_spectral_flux(self, audio_data, sample_rate):
+    def _scale_to_peak(self, samples):
         """
-        Calculate spectral flux for onset detection
+        Scale a float32 array in place so its largest magnitude is 1
+        
+        Parameters:
+            samples: 1D float32 numpy array the caller owns
+            
+        Returns:
+            The same array, for chaining
+        """
+        # max and -min instead of np.abs(...).max(): no full-size temporary
+        peak = max(np.max(samples), -np.min(samples)) if samples.size else 0
+        if peak > 0:
+            samples *= np.float32(1.0 / peak)
+        return samples
+    
+    def _frame_audio(self, audio_data):
+        """
+        Split audio into overlapping frames without copying
         
         Parameters:
             audio_data: 1D numpy array of audio samples
-            sample_rate: Audio sample rate
             
         Returns:
-            Array of spectral flux values
+            Read-only 2D view of shape (n_frames, frame_size), one row per hop
         """
-        flux = []
-        prev_magnitude = None
+        # Same frame starts as range(0, len(audio_data) - frame_size, hop_size)
+        n_frames = len(range(0, len(audio_data) - self.frame_size, self.hop_size))
+        if n_frames == 0:
+            return np.empty((0, self.frame_size), dtype=audio_data.dtype)
+        return sliding_window_view(audio_data, self.frame_size)[::self.hop_size][:n_frames]
+    
+    def _scratch(self, key, shape, dtype=np.float32):
+        """
+        Reusable work buffer for the calling thread
+        
+        Each key keeps one flat buffer that only grows, so analyzing segment
+        after segment of the same length allocates nothing after the first.
         
-        for i in range(0, len(audio_data) - self.frame_size, self.hop_size):
-            # Extract frame and apply window function
-            frame = audio_data[i:i + self.frame_size] * np.hanning(self.frame_size)
+        Parameters:
+            key: Name of the buffer
+            shape: Shape of the array needed
+            dtype: Element type of the array needed
             
-            # Compute FFT and get magnitude spectrum
-            fft_values = np.fft.rfft(frame)
-            magnitude = np.abs(fft_values)
+        Returns:
+            Uninitialized array of the requested shape, valid until the next
+            request for the same key on this thread
+        """
+        buffers = getattr(self._scratch_local, 'buffers', None)
+        if buffers is None:
+            buffers = self._scratch_local.buffers = {}
+        size = int(np.prod(shape))
+        buf = buffers.get(key)
+        if buf is None or buf.dtype != dtype or buf.size < size:
+            buf = buffers[key] = np.empty(size, dtype=dtype)
+        return buf[:size].reshape(shape)
+    
+    def _envelopes_from_frames(self, frames):
+        """
+        Calculate energy (RMS) and spectral flux envelopes for onset detection,
+        visiting each block of frames once while it is still in cache
+        
+        Parameters:
+            frames: 2D array of audio frames from _frame_audio
             
-            # Calculate spectral flux as the sum of squared differences
-            if prev_magnitude is not None:
-                # Only consider positive changes
-                diff = np.maximum(0, magnitude - prev_magnitude)
-                flux_value = np.sum(diff**2)
-                flux.append(flux_value)
+        Returns:
+            Tuple of (energy, spectral flux) float32 arrays, in scratch buffers
+            that the next call on this thread overwrites
+        """
+        n_frames = len(frames)
+        if n_frames < 2:
+            energy = np.sqrt(np.einsum('ij,ij->i', frames, frames) * (1.0 / self.frame_size))
+            return energy, np.empty(0, dtype=np.float32)
+        
+        # Process frames in blocks sized to _MAX_MEM_BLOCK, reusing scratch buffers
+        n_cols = max(1, _MAX_MEM_BLOCK // (self.frame_size * 8))
+        n_rows = min(n_cols, n_frames)
+        n_bins = self._fft_n // 2 + 1
+        block_buf = self._scratch('block', (n_rows, self.frame_size),
+                                  np.result_type(frames.dtype, self._hann.dtype))
+        # Row 0 carries the previous block's last spectrum so the diff spans block boundaries
+        mag_buf = self._scratch('mag', (n_rows + 1, n_bins))
+        diff_buf = self._scratch('diff', (n_rows, n_bins)) if _flux_kernel is None else None
+        energy = self._scratch('energy', n_frames)
+        flux = self._scratch('flux', n_frames - 1)
+        
+        for start in range(0, n_frames, n_cols):
+            block = frames[start:start + n_cols]
+            n = len(block)
+            # Root mean square per frame
+            np.sqrt(np.einsum('ij,ij->i', block, block) * (1.0 / self.frame_size),
+                    out=energy[start:start + n])
+            windowed = block_buf[:n]
+            # Apply window function and compute magnitude spectra for the whole block
+            np.multiply(block, self._hann, out=windowed)
+            np.abs(scipy.fft.rfft(windowed, n=self._fft_n, axis=1, workers=-1), out=mag_buf[1:n + 1])
             
-            prev_magnitude = magnitude
+            # Calculate spectral flux as the sum of squared differences,
+            # only considering positive changes
+            first = 1 if start == 0 else 0
+            mag = mag_buf[first:n + 1]
+            if _flux_kernel is not None:
+                _flux_kernel(mag, flux[start - 1 + first:start + n - 1])
+            else:
+                diff = diff_buf[:len(mag) - 1]
+                np.subtract(mag[1:], mag[:-1], out=diff)
+                np.maximum(diff, 0, out=diff)
+                flux[start - 1 + first:start + n - 1] = np.einsum('ij,ij->i', diff, diff)
+            mag_buf[0] = mag_buf[n]
         
         # Normalize flux values
-        if flux:
-            max_flux = np.max(flux)
-            if max_flux > 0:
-                flux = np.array(flux) / max_flux
+        max_flux = np.max(flux)
+        if max_flux > 0:
+            flux *= np.float32(1.0 / max_flux)
         
-        return flux
+        return energy, flux
     
     def _calculate_bpm_candidates(self, beats, sample_rate):
         """
@@ -172,28 +560,18 @@ class BPMAnalyzer:
         if len(beats) < 2:
             return []
         
-        # Calculate beat intervals (in seconds)
-        intervals = []
-        for i in range(1, len(beats)):
-            interval = beats[i] - beats[i-1]
-            intervals.append(interval)
-        
-        # Convert intervals to BPM
-        bpm_candidates = []
-        for interval in intervals:
-            if interval > 0:
-                # Calculate base BPM (quarter note)
-                base_bpm = 60 / interval
-                
-                # Also consider common beat subdivisions and multiples
-                # (eighth note, half note, whole note, etc.)
-                for ratio in [0.5, 1.0, 2.0]:
-                    candidate = base_bpm * ratio
-                    # Keep BPM in reasonable range (40-220 BPM)
-                    if 40 <= candidate <= 220:
-                        bpm_candidates.append(candidate)
-        
-        return bpm_candidates
+        # Calculate beat intervals (in seconds) and convert to base BPM (quarter note)
+        intervals = np.diff(beats)
+        base_bpm = 60 / intervals[intervals > 0]
+        
+        # Also consider common beat subdivisions and multiples
+        # (eighth note, half note, whole note, etc.)
+        bpm_candidates = (base_bpm[:, None] * np.array([0.5, 1.0, 2.0])).ravel()
+        
+        # Keep BPM in reasonable range (40-220 BPM)
+        bpm_candidates = bpm_candidates[(bpm_candidates >= 40) & (bpm_candidates <= 220)]
+        
+        return bpm_candidates.tolist()
     
     def _filter_outliers_iqr(self, values):
         """
@@ -211,9 +589,8 @@ class BPMAnalyzer:
         # Convert to numpy array
         values_array = np.array(values)
         
-        # Calculate Q1, Q3, and IQR
-        q1 = np.percentile(values_array, 25)
-        q3 = np.percentile(values_array, 75)
+        # Calculate Q1, Q3 (one partition pass for both), and IQR
+        q1, q3 = np.quantile(values_array, [0.25, 0.75])
         iqr = q3 - q1
         
         # Define outlier bounds
@@ -234,17 +611,14 @@ class BPMAnalyzer:
             window_size: Size of the moving window
             
         Returns:
-            List of smoothed values
+            Array of smoothed values
         """
         if len(values) < window_size:
             return values
-            
-        smoothed = []
-        for i in range(len(values) - window_size + 1):
-            window = values[i:i + window_size]
-            smoothed.append(np.mean(window))
         
-        return smoothed
+        # Window sums as differences of a running cumulative sum
+        cumsum = np.concatenate(([0.0], np.cumsum(values, dtype=np.float64)))
+        return (cumsum[window_size:] - cumsum[:-window_size]) / window_size
     
     def analyze_audio_file(self, file_path):
         """
@@ -257,25 +631,10 @@ class BPMAnalyzer:
             BPM value
         """
         try:
-            # Load audio file using pydub
-            audio = AudioSegment.from_file(file_path)
-            
-            # Convert to mono if stereo
-            if audio.channels > 1:
-                audio = audio.set_channels(1)
-            
-            # Set sample rate to 44.1kHz for consistency
-            audio = audio.set_frame_rate(44100)
+            samples, sample_rate = self._load_audio_file(file_path)
             
-            # Convert to numpy array
-            samples = np.array(audio.get_array_of_samples())
-            
-            # Normalize to [-1, 1]
-            max_val = 2 ** (audio.sample_width * 8 - 1)
-            samples = samples.astype(np.float32) / max_val
-            
-            # Analyze audio data
-            bpm = self.analyze_audio_data(samples, audio.frame_rate)
+            # Analyze audio data (the loader already scaled it to peak 1)
+            bpm = self.analyze_audio_data(samples, sample_rate, assume_normalized=True)
             
             return bpm
             
@@ -283,6 +642,209 @@ class BPMAnalyzer:
             print(f"Error analyzing audio file: {e}")
             return 0
     
+    def _load_audio_file(self, file_path, target_rate=44100):
+        """
+        Decode an audio file to mono float32 samples scaled to peak 1
+        
+        Uses soundfile when available, which decodes straight into a float32
+        buffer; otherwise PCM WAV files are decoded directly, formats
+        libsndfile lacks (MP3/AAC) are streamed through audioread when it is
+        installed, and everything else falls back to pydub.
+        
+        Parameters:
+            file_path: Path to audio file
+            target_rate: Sample rate to resample to for consistency
+            
+        Returns:
+            Tuple of (samples, sample_rate)
+        """
+        decoded = None
+        if sf is not None:
+            try:
+                decoded = sf.read(file_path, dtype='float32', always_2d=False)
+            except (sf.LibsndfileError, RuntimeError):
+                pass
+        if decoded is None and file_path.lower().endswith('.wav'):
+            decoded = self._decode_wav(file_path)
+        if decoded is None and audioread is not None:
+            decoded = self._decode_audioread(file_path)
+        if decoded is not None:
+            samples, sample_rate = decoded
+            samples = self._mix_to_mono(samples)
+            if sample_rate != target_rate:
+                samples = signal.resample_poly(samples, target_rate, sample_rate).astype(np.float32, copy=False)
+            return self._scale_to_peak(samples), target_rate
+        
+        # Load audio file using pydub
+        audio = AudioSegment.from_file(file_path)
+        
+        # Convert to mono if stereo
+        if audio.channels > 1:
+            audio = audio.set_channels(1)
+        
+        # Set sample rate to 44.1kHz for consistency
+        audio = audio.set_frame_rate(target_rate)
+        
+        # View the decoded samples without an intermediate copy, find the peak
+        # on the integers, and normalize in the float32 conversion buffer
+        raw = audio.get_array_of_samples()
+        ints = np.frombuffer(raw, dtype=raw.typecode)
+        peak = max(int(np.max(ints)), -int(np.min(ints))) if ints.size else 0
+        samples = ints.astype(np.float32)
+        if peak > 0:
+            samples *= np.float32(1.0 / peak)
+        return samples, audio.frame_rate
+    
+    def _decode_audioread(self, file_path):
+        """
+        Decode a file through audioread's streamed 16-bit PCM blocks
+        
+        The blocks are joined once and viewed as int16 frames, avoiding
+        pydub's in-memory AudioSegment and Python array intermediate.
+        
+        Parameters:
+            file_path: Path to audio file
+            
+        Returns:
+            Tuple of (samples, sample_rate), or None if no backend can decode it
+        """
+        try:
+            with audioread.audio_open(file_path) as f:
+                channels, sample_rate = f.channels, f.samplerate
+                pcm = b''.join(f)
+        except audioread.DecodeError:
+            return None
+        ints = np.frombuffer(pcm, dtype='<i2')
+        samples = ints[:len(ints) - len(ints) % channels].astype(np.float32)
+        if channels > 1:
+            samples = samples.reshape(-1, channels)
+        return samples, sample_rate
+    
+    def _mix_to_mono(self, samples):
+        """
+        Convert to mono if stereo: sum the channel columns into one float32
+        buffer (the 1/channels scale is absorbed by the peak normalization)
+        """
+        if samples.ndim == 1:
+            return samples
+        mono = samples[:, 0].copy()
+        for channel in range(1, samples.shape[1]):
+            mono += samples[:, channel]
+        return mono
+    
+    def stream_audio_segments(self, file_path, segment_duration, queue_size=4):
+        """
+        Decode a file segment by segment on a background thread
+        
+        A producer thread reads consecutive full-length segments through
+        soundfile into a bounded queue while the caller analyzes the ones
+        already decoded, so decoding overlaps analysis and at most
+        queue_size segments are held in memory. Segments stay at the file's
+        own sample rate (analysis decimates anyway), and a trailing partial
+        segment is dropped unless it is the only one, matching the
+        whole-file segmentation.
+        
+        Parameters:
+            file_path: Path to audio file
+            segment_duration: Segment length in seconds
+            queue_size: Maximum number of decoded segments waiting for analysis
+            
+        Returns:
+            Tuple of (segment count, iterator of (segment_time, samples, sample_rate)),
+            or None if soundfile is unavailable or cannot read the file
+        """
+        if sf is None:
+            return None
+        try:
+            info = sf.info(file_path)
+        except (sf.LibsndfileError, RuntimeError):
+            return None
+        sample_rate = info.samplerate
+        segment_frames = int(segment_duration * sample_rate)
+        if segment_frames <= 0 or info.frames <= 0:
+            return None
+        total_segments = max(1, info.frames // segment_frames)
+        decoded = queue.Queue(maxsize=queue_size)
+        # Set once the consumer finishes or is abandoned (an analysis error,
+        # close()), so a producer waiting on a full queue exits and closes the file
+        stop = threading.Event()
+        
+        def put(item):
+            while not stop.is_set():
+                try:
+                    decoded.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+        
+        def produce():
+            try:
+                with sf.SoundFile(file_path) as f:
+                    for i in range(total_segments):
+                        block = f.read(segment_frames, dtype='float32', always_2d=True)
+                        if not put((i * segment_frames / sample_rate, self._mix_to_mono(block))):
+                            return
+                put(None)
+            except Exception as e:
+                put(e)
+        
+        def consume():
+            # The producer starts with the first next(), so it is always
+            # paired with the finally below that releases it
+            threading.Thread(target=produce, daemon=True).start()
+            try:
+                while True:
+                    item = decoded.get()
+                    if item is None:
+                        return
+                    if isinstance(item, Exception):
+                        raise item
+                    segment_time, samples = item
+                    yield segment_time, samples, sample_rate
+            finally:
+                stop.set()
+        
+        return total_segments, consume()
+    
+    def _decode_wav(self, file_path):
+        """
+        Decode a PCM WAV file directly, bypassing pydub
+        
+        Parameters:
+            file_path: Path to WAV file
+            
+        Returns:
+            Tuple of (float32 samples, sample_rate), with shape (frames, channels)
+            for multichannel files, or None if the file is not a supported PCM WAV
+        """
+        with open(file_path, 'rb') as f:
+            header = _read_wav_header(f)
+            if header is None:
+                return None
+            n_channels, sample_rate, sample_width, data_size = header
+            data_offset = f.tell()
+            # Clamp to the bytes actually present (streamed WAVs may carry a
+            # placeholder size) and drop any trailing partial frame
+            data_size = min(data_size, os.fstat(f.fileno()).st_size - data_offset)
+            data_size -= data_size % (sample_width * n_channels)
+        
+        decoder = _WAV_DECODERS.get(sample_width)
+        if decoder is None:
+            return None
+        if data_size <= 0:
+            return np.empty(0, dtype=np.float32), sample_rate
+        
+        # Map the sample data instead of reading it into a bytes copy; the
+        # decoder's float32 conversion pages it in sequentially
+        data = np.memmap(file_path, dtype=np.uint8, mode='r', offset=data_offset, shape=(data_size,))
+        samples = decoder(data)
+        del data
+        
+        if n_channels > 1:
+            samples = samples[:len(samples) // n_channels * n_channels].reshape(-1, n_channels)
+        return samples, sample_rate
+    
     def analyze_audio_segment(self, audio_segment, sample_rate):
         """
         Analyze a segment of audio data
@@ -295,6 +857,26 @@ class BPMAnalyzer:
             BPM value for the segment
         """
         return self.analyze_audio_data(audio_segment, sample_rate)
+    
+    def analyze_audio_segments(self, segments, sample_rate, num_threads=None):
+        """
+        Analyze several segments of audio data concurrently
+        
+        The NumPy reductions and SciPy FFTs release the GIL, so threads scale
+        across cores while sharing the segment arrays (unlike a process pool,
+        nothing is pickled or duplicated per worker).
+        
+        Parameters:
+            segments: Sequence of 1D numpy arrays of audio samples
+            sample_rate: Audio sample rate
+            num_threads: Maximum number of worker threads (None for the executor default)
+            
+        Returns:
+            List of BPM values, one per segment, in input order
+        """
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            return list(executor.map(lambda seg: self.analyze_audio_data(seg, sample_rate),
+                                     segments))
 
     def _bpm_to_category(self, bpm):
         """
@@ -306,19 +888,4 @@ class BPMAnalyzer:
         Returns:
             String description of the BPM category
         """
-        if bpm >= 200:
-            return "Extremely Fast (Electronic Hardcore)"
-        elif bpm >= 175:
-            return "Very Fast (Drum & Bass, Gabber)"
-        elif bpm >= 150:
-            return "Fast (Trance, Hardstyle)"
-        elif bpm >= 130:
-            return "Moderately Fast (House, Techno)"
-        elif bpm >= 110:
-            return "Medium (Pop, Rock, EDM)"
-        elif bpm >= 90:
-            return "Moderately Slow (Hip Hop, R&B)"
-        elif bpm >= 70:
-            return "Slow (Ballads, Reggae)"
-        else:
-            return "Very Slow (Ambient, Doom Metal)"
\ No newline at end of file
+        return _BPM_LABELS[bisect.bisect_right(_BPM_BREAKS, bpm)]
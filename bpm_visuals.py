@@ -1,5 +1,75 @@
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.lines import Line2D
+
+
+# Generator for the box plot's horizontal scatter jitter (cosmetic only)
+_RNG = np.random.default_rng()
+
+# Label backgrounds for the violin mean/median annotations; Text.set_bbox copies
+# the dict, so the shared constants are never mutated
+_BBOX_ORANGE = dict(facecolor='white', edgecolor='#F18F01', alpha=0.6, pad=1.5)
+_BBOX_GREY = dict(facecolor='white', edgecolor='#333333', alpha=0.6, pad=1.5)
+
+# Legend proxies for the violin plot's mean/median lines; legend() copies their
+# style into its own artists, so one stateless pair serves every figure
+_VIOLIN_LEGEND_HANDLES = (
+    Line2D([0], [0], color='#F18F01', linestyle='-', linewidth=2, label='Mean'),
+    Line2D([0], [0], color='#333333', linestyle='-', linewidth=2, label='Median'),
+)
+
+
+def _as_f64(x):
+    """
+    Return x as a float64 ndarray, without copying when it already is one
+    """
+    return x if isinstance(x, np.ndarray) and x.dtype == np.float64 else np.asarray(x, dtype=np.float64)
+
+
+def prepare_plot_arrays(valid_times, valid_bpms, ref_series):
+    """
+    Convert the plot inputs once so the plotters can share them without re-converting.
+
+    Parameters:
+    - valid_times: timestamps (seconds)
+    - valid_bpms: microphone BPMs aligned with valid_times
+    - ref_series: reference BPMs aligned with valid_times
+
+    Returns:
+    - (times, mic, ref, dev): float64 C-contiguous arrays, with dev = mic - ref
+    """
+    times = np.ascontiguousarray(valid_times, dtype=np.float64)
+    mic = np.ascontiguousarray(valid_bpms, dtype=np.float64)
+    ref = np.ascontiguousarray(ref_series, dtype=np.float64)
+    return times, mic, ref, mic - ref
+
+
+# Sorted arrays of the last reference list, as (list, length, times, bpms).
+# The list itself is held, so a hit is an identity match that a freed and
+# reallocated list can never fake; the app replaces the list on every new
+# analysis rather than editing it in place.
+_REF_CACHE = None
+
+
+def _sorted_reference(reference_pairs):
+    """
+    Return (times, bpms) float64 arrays of reference_pairs ordered by time,
+    memoized for the most recent reference list; already-sorted input skips the sort.
+    """
+    global _REF_CACHE
+    n = len(reference_pairs)
+    cached = _REF_CACHE
+    if cached is not None and cached[0] is reference_pairs and cached[1] == n:
+        return cached[2], cached[3]
+    # One conversion to an (n, 2) array, then read the columns (SoA)
+    pairs = np.asarray(reference_pairs, dtype=np.float64).reshape(n, 2)
+    ref_times_np, ref_bpms_np = pairs[:, 0], pairs[:, 1]
+    if not np.all(ref_times_np[:-1] <= ref_times_np[1:]):
+        order = np.argsort(ref_times_np, kind='stable')
+        ref_times_np = ref_times_np[order]
+        ref_bpms_np = ref_bpms_np[order]
+    _REF_CACHE = (reference_pairs, n, ref_times_np, ref_bpms_np)
+    return ref_times_np, ref_bpms_np
 
 
 def plot_deviation_heatmap(ax_heatmap, valid_times, valid_bpms, ref_series, sheet_bpm, segment_count=8):
@@ -18,7 +88,7 @@ def plot_deviation_heatmap(ax_heatmap, valid_times, valid_bpms, ref_series, shee
     Returns:
     - im: the matplotlib image object returned by `imshow`, suitable for colorbar
     """
-    if not valid_times or not valid_bpms:
+    if len(valid_times) == 0 or len(valid_bpms) == 0:
         # Nothing to render; create an empty placeholder heatmap
         im = ax_heatmap.imshow([[0] * max(1, segment_count)], cmap='RdBu_r', aspect='auto', vmin=-10, vmax=10,
                                extent=[0, max(1, segment_count), 0, 1])
@@ -29,31 +99,32 @@ def plot_deviation_heatmap(ax_heatmap, valid_times, valid_bpms, ref_series, shee
         ax_heatmap.set_xticklabels(["-"] * max(1, segment_count), fontsize=6)
         return im
 
-    valid_bpms_np = np.array(valid_bpms)
-    ref_series_np = np.array(ref_series)
+    valid_bpms_np = _as_f64(valid_bpms)
+    ref_series_np = _as_f64(ref_series)
 
     segment_count = segment_count if len(valid_times) >= segment_count else max(1, len(valid_times))
     t_start, t_end = valid_times[0], valid_times[-1]
     bounds = np.linspace(t_start, t_end, segment_count + 1)
-    percent_deviations = []
-    times_np = np.array(valid_times)
-
-    for i in range(segment_count):
-        left = bounds[i]
-        right = bounds[i + 1]
-        if i < segment_count - 1:
-            mask = (times_np >= left) & (times_np < right)
-        else:
-            mask = (times_np >= left) & (times_np <= right)
-        if np.any(mask):
-            seg_mic = valid_bpms_np[mask]
-            seg_ref = ref_series_np[mask]
-            diff_mean = float(np.mean(seg_mic - seg_ref))
-            ref_mean = float(np.mean(seg_ref)) if np.any(seg_ref) else float(sheet_bpm)
-            pct = (diff_mean / ref_mean) * 100 if ref_mean > 0 else 0.0
-        else:
-            pct = 0.0  # no data in segment; neutral color
-        percent_deviations.append(pct)
+    times_np = _as_f64(valid_times)
+
+    # Bucket every sample into its segment once: segment i holds
+    # bounds[i] <= t < bounds[i + 1], and the last one also holds t_end;
+    # bincount then sums all segments in one pass each
+    seg_ids = np.searchsorted(bounds, times_np, side='right') - 1
+    np.clip(seg_ids, 0, segment_count - 1, out=seg_ids)
+    counts = np.bincount(seg_ids, minlength=segment_count)
+    sum_mic = np.bincount(seg_ids, weights=valid_bpms_np, minlength=segment_count)
+    sum_ref = np.bincount(seg_ids, weights=ref_series_np, minlength=segment_count)
+    nonzero_ref = np.bincount(seg_ids, weights=ref_series_np != 0, minlength=segment_count)
+    has_data = counts > 0
+    safe_counts = np.maximum(counts, 1)
+    diff_mean = (sum_mic - sum_ref) / safe_counts
+    ref_mean = np.where(nonzero_ref > 0, sum_ref / safe_counts, float(sheet_bpm))
+    valid_ref = has_data & (ref_mean > 0)
+    # Empty segments get a neutral 0.0
+    percent_deviations = np.zeros(segment_count)
+    percent_deviations[valid_ref] = diff_mean[valid_ref] / ref_mean[valid_ref] * 100
+    percent_deviations = percent_deviations.tolist()
 
     # Render single-row heatmap with labeled segments
     im = ax_heatmap.imshow([percent_deviations], cmap='RdBu_r', aspect='auto', vmin=-10, vmax=10,
@@ -62,7 +133,9 @@ def plot_deviation_heatmap(ax_heatmap, valid_times, valid_bpms, ref_series, shee
     ax_heatmap.set_yticks([])
     ax_heatmap.set_title('Tempo Deviation Heatmap (%)', fontsize=7, fontweight='bold', pad=4)
     ax_heatmap.set_xticks(np.arange(segment_count) + 0.5)
-    interval_labels = [f"{bounds[i]:.0f}–{bounds[i+1]:.0f}s" for i in range(segment_count)]
+    # Format each boundary once; np.rint rounds half-to-even like the '.0f' format did
+    edges = np.rint(bounds).astype(np.int64).astype(str)
+    interval_labels = np.char.add(np.char.add(edges[:-1], '–'), np.char.add(edges[1:], 's')).tolist()
     ax_heatmap.set_xticklabels(interval_labels, fontsize=6)
 
     for i, pct in enumerate(percent_deviations):
@@ -86,40 +159,35 @@ def plot_bpm_timeseries(ax_ts, valid_times, valid_bpms, sheet_bpm, reference_pai
 
     Returns:
     - ref_series: numpy array aligned to valid_times representing the reference BPM series
+    - valid_bpms_np: float64 array of valid_bpms, reusable by the other plotters
     """
-    ax_ts.plot(valid_times, valid_bpms, color='#2E86AB', linewidth=2, alpha=0.8, label='Real-time Microphone BPM')
+    valid_bpms_np = _as_f64(valid_bpms)
+    ax_ts.plot(valid_times, valid_bpms_np, color='#2E86AB', linewidth=2, alpha=0.8, label='Real-time Microphone BPM')
     ax_ts.axhline(y=sheet_bpm, color='#A23B72', linestyle='--', linewidth=2, label=f'Reference BPM: {sheet_bpm:.1f}')
-    mean_bpm = np.mean(valid_bpms) if len(valid_bpms) > 0 else sheet_bpm
+    mean_bpm = valid_bpms_np.mean() if len(valid_bpms_np) > 0 else sheet_bpm
     ax_ts.axhline(y=mean_bpm, color='#F18F01', linestyle='--', linewidth=2, label=f'Average BPM: {mean_bpm:.1f}')
 
     # Build reference time series aligned to mic timestamps
     ref_at_times_np = None
-    try:
-        if reference_pairs:
-            ref_pairs_sorted = sorted(reference_pairs, key=lambda x: x[0])
-            ref_times = [t for t, _ in ref_pairs_sorted]
-            ref_bpms_series = [b for _, b in ref_pairs_sorted]
-            if len(ref_times) >= 2:
-                ref_times_np = np.array(ref_times)
-                ref_bpms_np = np.array(ref_bpms_series)
-                ref_at_times_np = np.interp(valid_times, ref_times_np, ref_bpms_np)
-            elif len(ref_times) == 1:
-                ref_at_times_np = np.array([ref_bpms_series[0]] * len(valid_times))
-    except Exception:
-        ref_at_times_np = None
+    if reference_pairs is not None and len(reference_pairs) > 0 and len(valid_times) > 0:
+        ref_times_np, ref_bpms_np = _sorted_reference(reference_pairs)
+        if len(ref_times_np) >= 2:
+            ref_at_times_np = np.interp(valid_times, ref_times_np, ref_bpms_np)
+        else:
+            ref_at_times_np = np.full(len(valid_times), ref_bpms_np[0], dtype=np.float64)
 
     if ref_at_times_np is None or len(ref_at_times_np) != len(valid_times):
-        ref_series = np.array([sheet_bpm] * len(valid_times))
+        ref_series = np.full(len(valid_times), sheet_bpm, dtype=np.float64)
     else:
         ref_series = ref_at_times_np
 
-    valid_bpms_np = np.array(valid_bpms)
     ax_ts.plot(valid_times, ref_series, color='#A23B72', linewidth=1, alpha=0.7, label='Reference BPM (time series)')
+    faster = valid_bpms_np > ref_series
     ax_ts.fill_between(valid_times, ref_series, valid_bpms_np,
-                       where=(valid_bpms_np > ref_series),
+                       where=faster,
                        color='#C44536', alpha=0.2, label='Faster than reference')
     ax_ts.fill_between(valid_times, ref_series, valid_bpms_np,
-                       where=(valid_bpms_np <= ref_series),
+                       where=~faster,
                        color='#5B8C5A', alpha=0.2, label='Slower than reference')
 
     ax_ts.set_xlabel('Time (seconds)', fontsize=7)
@@ -129,10 +197,29 @@ def plot_bpm_timeseries(ax_ts, valid_times, valid_bpms, sheet_bpm, reference_pai
     ax_ts.legend(fontsize=6)
     ax_ts.grid(True, alpha=0.3)
 
-    return ref_series
+    return ref_series, valid_bpms_np
 
 
-def plot_distributions(ax_violin, ax_box, valid_bpms, ref_series):
+def _draw_empty_distributions(ax_violin, ax_box):
+    """
+    Label the violin and box axes without data, skipping the stats and label layout
+    """
+    ax_violin.set_ylabel('BPM', fontsize=7)
+    ax_violin.set_title('BPM Distribution (Mic vs Reference)', fontsize=7, fontweight='bold', pad=4)
+    ax_violin.set_xticks([1, 2])
+    ax_violin.set_xticklabels(['Mic', 'Reference'])
+    ax_violin.set_xlim(0.6, 2.4)
+    ax_violin.tick_params(axis='both', labelsize=6)
+    ax_violin.grid(True, alpha=0.3)
+    ax_box.set_ylabel('BPM difference (Mic - Reference)', fontsize=7)
+    ax_box.set_title('Deviation Distribution (Mic vs Reference)', fontsize=7, fontweight='bold', pad=4)
+    ax_box.set_xticks([1])
+    ax_box.set_xticklabels(['Diff'])
+    ax_box.tick_params(axis='both', labelsize=6)
+    ax_box.grid(True, alpha=0.3)
+
+
+def plot_distributions(ax_violin, ax_box, valid_bpms, ref_series, deviations=None):
     """
     Render violin plot (Mic vs Reference) and box plot of deviations.
 
@@ -141,9 +228,16 @@ def plot_distributions(ax_violin, ax_box, valid_bpms, ref_series):
     - ax_box: axes for box plot
     - valid_bpms: list/np.array of mic BPMs
     - ref_series: np.array reference BPMs aligned to valid_times
+    - deviations: optional precomputed valid_bpms - ref_series (see prepare_plot_arrays)
     """
+    mic = _as_f64(valid_bpms)
+    ref = _as_f64(ref_series)
+    if len(mic) == 0 or len(ref) == 0:
+        _draw_empty_distributions(ax_violin, ax_box)
+        return
+
     # Violin plot
-    violin_parts = ax_violin.violinplot([valid_bpms, ref_series], positions=[1, 2], showmeans=True, showmedians=True)
+    violin_parts = ax_violin.violinplot([mic, ref], positions=[1, 2], showmeans=True, showmedians=True)
     for i, pc in enumerate(violin_parts['bodies']):
         pc.set_facecolor('#2E86AB' if i == 0 else '#A23B72')
         pc.set_alpha(0.6)
@@ -163,108 +257,50 @@ def plot_distributions(ax_violin, ax_box, valid_bpms, ref_series):
     ax_violin.set_xticklabels(['Mic', 'Reference'])
 
     # Mean/median labels (with description and overlap avoidance)
-    mean_mic = float(np.mean(valid_bpms)) if len(valid_bpms) > 0 else float('nan')
-    median_mic = float(np.median(valid_bpms)) if len(valid_bpms) > 0 else float('nan')
-    mean_ref = float(np.mean(ref_series)) if len(ref_series) > 0 else float('nan')
-    median_ref = float(np.median(ref_series)) if len(ref_series) > 0 else float('nan')
+    # Stats come from the arrays converted above (non-empty past the early
+    # return); np.median selects by partition
+    mean_mic = float(mic.mean())
+    median_mic = float(np.median(mic))
+    mean_ref = float(ref.mean())
+    median_ref = float(np.median(ref))
 
     # Compute dynamic vertical offset based on axis range
     ylim_low, ylim_high = ax_violin.get_ylim()
     yrange = max(1e-6, ylim_high - ylim_low)
     dy = max(6.0, yrange * 0.06)
 
-    # Mic labels: avoid overlap if mean and median are close
-    mic_mean_y = mean_mic
-    mic_median_y = median_mic
-    x_mic_mean = 1.12
-    x_mic_median = 1.12
-    if np.isfinite(mic_mean_y) and np.isfinite(mic_median_y) and abs(mic_mean_y - mic_median_y) < dy * 1.1:
-        if mic_mean_y >= mic_median_y:
-            mic_mean_y = mean_mic + dy / 2
-            mic_median_y = median_mic - dy / 2
-        else:
-            mic_mean_y = mean_mic - dy / 2
-            mic_median_y = median_mic + dy / 2
-        # Slight horizontal stagger to further reduce overlap
-        x_mic_mean = 1.11
-        x_mic_median = 1.18
-
-    ax_violin.text(
-        x_mic_mean,
-        mic_mean_y,
-        f"Mean: {mean_mic:.1f}",
-        fontsize=6,
-        color='#F18F01',
-        va='center',
-        ha='left',
-        bbox=dict(facecolor='white', edgecolor='#F18F01', alpha=0.6, pad=1.5)
-    )
-    ax_violin.text(
-        x_mic_median,
-        mic_median_y,
-        f"Median: {median_mic:.1f}",
-        fontsize=6,
-        color='#333333',
-        va='center',
-        ha='left',
-        bbox=dict(facecolor='white', edgecolor='#333333', alpha=0.6, pad=1.5)
-    )
-
-    # Reference labels: avoid overlap if mean and median are close
-    ref_mean_y = mean_ref
-    ref_median_y = median_ref
-    x_ref_mean = 2.12
-    x_ref_median = 2.12
-    if np.isfinite(ref_mean_y) and np.isfinite(ref_median_y) and abs(ref_mean_y - ref_median_y) < dy * 1.1:
-        if ref_mean_y >= ref_median_y:
-            ref_mean_y = mean_ref + dy / 2
-            ref_median_y = median_ref - dy / 2
-        else:
-            ref_mean_y = mean_ref - dy / 2
-            ref_median_y = median_ref + dy / 2
-        # Slight horizontal stagger
-        x_ref_mean = 2.11
-        x_ref_median = 2.18
-
-    ax_violin.text(
-        x_ref_mean,
-        ref_mean_y,
-        f"Mean: {mean_ref:.1f}",
-        fontsize=6,
-        color='#F18F01',
-        va='center',
-        ha='left',
-        bbox=dict(facecolor='white', edgecolor='#F18F01', alpha=0.6, pad=1.5)
-    )
-    ax_violin.text(
-        x_ref_median,
-        ref_median_y,
-        f"Median: {median_ref:.1f}",
-        fontsize=6,
-        color='#333333',
-        va='center',
-        ha='left',
-        bbox=dict(facecolor='white', edgecolor='#333333', alpha=0.6, pad=1.5)
-    )
+    # Label mean and median beside each violin; when the two are close, push them
+    # apart vertically by dy and stagger them horizontally to avoid overlap
+    for x_base, mean_val, median_val in ((1.0, mean_mic, median_mic), (2.0, mean_ref, median_ref)):
+        mean_y, median_y = mean_val, median_val
+        x_mean = x_median = x_base + 0.12
+        if abs(mean_val - median_val) < dy * 1.1:
+            shift = dy / 2 if mean_val >= median_val else -dy / 2
+            mean_y = mean_val + shift
+            median_y = median_val - shift
+            x_mean = x_base + 0.11
+            x_median = x_base + 0.18
+        for x, y, text, color, bbox in ((x_mean, mean_y, f"Mean: {mean_val:.1f}", '#F18F01', _BBOX_ORANGE),
+                                        (x_median, median_y, f"Median: {median_val:.1f}", '#333333', _BBOX_GREY)):
+            ax_violin.text(x, y, text, fontsize=6, color=color, va='center', ha='left', bbox=bbox)
 
     ax_violin.set_xlim(0.6, 2.4)
     ax_violin.tick_params(axis='both', labelsize=6)
 
     # Add legend explaining horizontal lines (mean vs median)
-    from matplotlib.lines import Line2D
-    mean_handle = Line2D([0], [0], color='#F18F01', linestyle='-', linewidth=2, label='Mean')
-    median_handle = Line2D([0], [0], color='#333333', linestyle='-', linewidth=2, label='Median')
-    ax_violin.legend(handles=[mean_handle, median_handle], fontsize=6, loc='upper right', framealpha=0.6)
+    ax_violin.legend(handles=list(_VIOLIN_LEGEND_HANDLES), fontsize=6, loc='upper right', framealpha=0.6)
 
     ax_violin.grid(True, alpha=0.3)
 
     # Box plot of deviations
-    deviations = np.array(valid_bpms) - np.array(ref_series)
+    if deviations is None:
+        deviations = mic - ref
+    mean_dev = deviations.mean()
     bp = ax_box.boxplot([deviations], positions=[1], patch_artist=True, widths=0.6)
-    jitter = np.random.normal(0, 0.05, len(deviations))
+    jitter = _RNG.standard_normal(len(deviations)) * 0.05
     ax_box.scatter(np.ones_like(deviations) + jitter, deviations, alpha=0.3, color='#2E86AB', s=12)
     ax_box.axhline(0, color='black', linestyle='-', linewidth=1)
-    ax_box.axhline(np.mean(deviations), color='#A23B72', linestyle='--', linewidth=2, label=f'Mean diff: {np.mean(deviations):.2f}')
+    ax_box.axhline(mean_dev, color='#A23B72', linestyle='--', linewidth=2, label=f'Mean diff: {mean_dev:.2f}')
     bp['boxes'][0].set_facecolor('#F18F01')
     bp['boxes'][0].set_alpha(0.6)
     bp['medians'][0].set_color('#A23B72')
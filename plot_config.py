@@ -1,6 +1,18 @@
 from matplotlib import rcParams
 
+# CJK-capable fonts first, DejaVu Sans as the always-available fallback
+_SANS_SERIF_FONTS = (
+    'SimHei', 'Microsoft YaHei', 'Noto Sans CJK SC', 'PingFang SC',
+    'Heiti SC', 'Arial Unicode MS', 'DejaVu Sans'
+)
+
+_STYLE_APPLIED = False
+
 def apply_plot_style():
+    global _STYLE_APPLIED
+    if _STYLE_APPLIED:
+        return
+    _STYLE_APPLIED = True
     rcParams.update({
         'figure.dpi': 160,
         'savefig.dpi': 160,
@@ -12,8 +24,5 @@ def apply_plot_style():
         'font.size': 9,
     })
     rcParams['font.family'] = 'sans-serif'
-    rcParams['font.sans-serif'] = [
-        'SimHei', 'Microsoft YaHei', 'Noto Sans CJK SC', 'PingFang SC',
-        'Heiti SC', 'Arial Unicode MS', 'DejaVu Sans'
-    ]
-    rcParams['axes.unicode_minus'] = False
\ No newline at end of file
+    rcParams['font.sans-serif'] = _SANS_SERIF_FONTS
+    rcParams['axes.unicode_minus'] = False
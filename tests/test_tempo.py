@@ -0,0 +1,41 @@
+import unittest
+
+import numpy as np
+
+from bpm_core import BPMAnalyzer
+
+
+def click_track(bpm, sample_rate, seconds=10.0):
+    """
+    Decaying 1 kHz clicks at a steady tempo, over faint noise
+    """
+    rng = np.random.default_rng(0)
+    audio = rng.normal(0, 0.02, int(sample_rate * seconds)).astype(np.float32)
+    n = np.arange(int(0.045 * sample_rate))
+    click = (np.sin(2 * np.pi * 1000 * n / sample_rate) * np.exp(-n / (0.007 * sample_rate))).astype(np.float32)
+    period = sample_rate * 60.0 / bpm
+    for start in np.arange(0, len(audio) - len(click), period).astype(int):
+        audio[start:start + len(click)] += click
+    return audio
+
+
+class AutocorrTempoTest(unittest.TestCase):
+    """
+    The default autocorrelation estimator must land on the played tempo, not
+    on half or a third of it
+    """
+
+    TEMPOS = (60, 70, 80, 90, 100, 110, 120, 128, 140, 150, 160, 174, 180)
+
+    def test_click_tracks(self):
+        analyzer = BPMAnalyzer()
+        for sample_rate in (22050, 44100, 48000):
+            for seconds in (6.0, 30.0):
+                for bpm in self.TEMPOS:
+                    with self.subTest(bpm=bpm, sample_rate=sample_rate, seconds=seconds):
+                        detected = analyzer.analyze_audio_data(click_track(bpm, sample_rate, seconds), sample_rate)
+                        self.assertAlmostEqual(detected, bpm, delta=2.0)
+
+
+if __name__ == '__main__':
+    unittest.main()